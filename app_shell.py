@@ -6,6 +6,8 @@
 import tkinter as tk  # For creating the GUI
 from tkinter import filedialog, messagebox, ttk  # Specific Tkinter components
 import logging # For logging application events and errors
+import os # For displaying the base name of the file being loaded
+from concurrent.futures import ThreadPoolExecutor # For running slow file I/O off the Tk main thread
 
 # --- Third-Party Library Imports ---
 import pandas as pd  # For data manipulation, primarily with DataFrames
@@ -61,7 +63,12 @@ class OpenJobsApp(tk.Tk):
                        foreground=[('selected', config.STATUS_COLORS["selected_fg"])])
 
         self.status_df = None
-        self.load_initial_data() # Calls updated data_utils.load_status() for SQLite
+        # Worker pool for blocking file I/O; results are always applied back on the Tk main thread.
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._excel_load_future = None
+        self._save_future = None
+        self._save_requested_again = False
+        self._loading_window = None
 
         self.notebook = None
         self.data_tab_instance = None
@@ -69,9 +76,19 @@ class OpenJobsApp(tk.Tk):
         self.export_tab_instance = None
         
         self.create_main_ui_layout()
-        
-        if self.data_tab_instance and self.status_df is not None:
+
+        # Let the (empty) window paint first; the database is read and shown once the event loop runs.
+        self.after(10, self._initial_load)
+
+    def _initial_load(self):
+        """Loads the saved status data after startup and fills the tabs with it."""
+        self.load_initial_data() # Calls updated data_utils.load_status() for SQLite
+        if self.status_df is None:
+            return # load_initial_data has already reported the error and closed the app
+
+        if self.data_tab_instance:
             self.data_tab_instance.populate_treeview()
+        self.notify_data_changed() # Tabs were built before any data was available
 
     def load_initial_data(self):
         """
@@ -98,7 +115,7 @@ class OpenJobsApp(tk.Tk):
         # Ensure date columns are of datetime type after reindexing and potential additions
         for col_name in ['Order Date', 'Turn in Date']:
             if col_name in self.status_df.columns:
-                self.status_df[col_name] = pd.to_datetime(self.status_df[col_name], errors='coerce')
+                self.status_df[col_name] = data_utils.to_datetime_column(self.status_df[col_name]) # No-op when load_status already converted it
 
 
     def maximize_window(self):
@@ -160,7 +177,7 @@ class OpenJobsApp(tk.Tk):
             return
         try:
             selected_tab_widget = self.notebook.nametowidget(self.notebook.select())
-            logging.debug(f"AppShell: Tab changed to: {self.notebook.tab(self.notebook.select(), 'text')}")
+            logging.debug("AppShell: Tab changed to: %s", self.notebook.tab(self.notebook.select(), 'text'))
             
             if hasattr(selected_tab_widget, 'on_tab_selected'):
                 selected_tab_widget.on_tab_selected()
@@ -169,6 +186,8 @@ class OpenJobsApp(tk.Tk):
 
     def notify_data_changed(self):
         logging.debug("AppShell: Data changed, notifying relevant tabs.")
+        if self.reporting_tab_instance and hasattr(self.reporting_tab_instance, 'invalidate_prepared_data'):
+            self.reporting_tab_instance.invalidate_prepared_data() # Cached report data is stale now
         if self.reporting_tab_instance and hasattr(self.reporting_tab_instance, 'on_tab_selected'):
             self.reporting_tab_instance.on_tab_selected() 
         
@@ -179,6 +198,15 @@ class OpenJobsApp(tk.Tk):
 
 
     def load_new_excel_data(self):
+        """
+        Asks for an Excel file and reads it on a worker thread so the window keeps
+        repainting while the workbook is parsed. The result is picked up by
+        _poll_excel_load and merged on the Tk main thread.
+        """
+        if self._excel_load_future is not None:
+            logging.info("AppShell: An Excel load is already in progress; ignoring new load request.")
+            return
+
         excel_file_path = filedialog.askopenfilename(
             title="Select Excel File",
             filetypes=[("Excel files", "*.xlsx;*.xls"), ("All files", "*.*")],
@@ -187,16 +215,67 @@ class OpenJobsApp(tk.Tk):
         if not excel_file_path:
             return
 
-        new_df_raw = data_utils.load_excel(excel_file_path) # Handles 'Invoice #'
+        self._show_loading_window(f"Loading {os.path.basename(excel_file_path)}...")
+        self._excel_load_future = self._executor.submit(data_utils.read_excel_file, excel_file_path) # Handles 'Invoice #'
+        self.after(50, self._poll_excel_load, excel_file_path)
+
+    def _poll_excel_load(self, excel_file_path):
+        """Checks the background Excel read every 50 ms and applies the result once it is done."""
+        future = self._excel_load_future
+        if future is None:
+            return
+        if not future.done():
+            self.after(50, self._poll_excel_load, excel_file_path)
+            return
+
+        self._excel_load_future = None
+        self._close_loading_window()
+
+        try:
+            new_df_raw = future.result()
+        except Exception as e:
+            data_utils.show_excel_load_error(excel_file_path, e)
+            return
         if new_df_raw is None:
+            data_utils.show_excel_load_error(excel_file_path)
             return
 
-        current_status_df_copy = self.status_df.copy() if self.status_df is not None else pd.DataFrame(columns=config.EXPECTED_COLUMNS)
+        self._apply_new_excel_data(new_df_raw)
+
+    def _show_loading_window(self, message):
+        """Shows a small modal window with an indeterminate progress bar."""
+        self._close_loading_window()
+        loading_window = tk.Toplevel(self)
+        loading_window.title("Please Wait")
+        loading_window.transient(self)
+        loading_window.resizable(False, False)
+        loading_window.protocol("WM_DELETE_WINDOW", lambda: None) # Closed by the app once loading finishes
+
+        ttk.Label(loading_window, text=message).pack(padx=config.DEFAULT_PADDING * 2, pady=(config.DEFAULT_PADDING * 2, config.DEFAULT_PADDING))
+        progress_bar = ttk.Progressbar(loading_window, mode='indeterminate', length=250)
+        progress_bar.pack(padx=config.DEFAULT_PADDING * 2, pady=(0, config.DEFAULT_PADDING * 2))
+        progress_bar.start(10)
+
+        self.center_toplevel(loading_window)
+        loading_window.grab_set() # Prevent edits to status_df while the new data is being read
+        self._loading_window = loading_window
+
+    def _close_loading_window(self):
+        if self._loading_window is not None:
+            self._loading_window.grab_release()
+            self._loading_window.destroy()
+            self._loading_window = None
+
+    def _apply_new_excel_data(self, new_df_raw):
+        """Merges freshly read Excel data into status_df and refreshes the UI (Tk main thread only)."""
+        # process_data reassigns the key column on the frame it is given, so it gets a shallow copy:
+        # the column replacement stays local while the column data itself is shared, not duplicated.
+        current_status_df_view = self.status_df.copy(deep=False) if self.status_df is not None else pd.DataFrame(columns=config.EXPECTED_COLUMNS)
         
         processed_df = None
         try:
             # process_data uses 'Invoice #' and handles data now coming from SQLite backed status_df
-            processed_df = data_utils.process_data(new_df_raw, current_status_df_copy) 
+            processed_df = data_utils.process_data(new_df_raw, current_status_df_view) 
 
             if processed_df is None:
                 messagebox.showerror("Processing Error",
@@ -226,11 +305,9 @@ class OpenJobsApp(tk.Tk):
             logging.error(f"AppShell: Unexpected error during Excel data processing: {e}", exc_info=True)
             return
         
-        self.status_df = processed_df.reindex(columns=config.EXPECTED_COLUMNS)
-        # Ensure date columns are datetime after processing and reindexing
-        for col_name in ['Order Date', 'Turn in Date']:
-            if col_name in self.status_df.columns:
-                self.status_df[col_name] = pd.to_datetime(self.status_df[col_name], errors='coerce')
+        # process_data already returns the frame reindexed to EXPECTED_COLUMNS with datetime date columns,
+        # so it is used as-is instead of being normalized a second time here.
+        self.status_df = processed_df
 
         if self.data_tab_instance:
             self.data_tab_instance.populate_treeview()
@@ -238,11 +315,61 @@ class OpenJobsApp(tk.Tk):
         self.notify_data_changed()
 
     def save_current_data(self):
-        """Saves the current status_df to SQLite via data_utils.save_status()."""
+        """
+        Saves the current status_df to SQLite. A snapshot is taken on the main thread and
+        written on a worker thread, so the UI does not wait for the disk.
+        """
         if self.status_df is None:
             messagebox.showerror("Error", "No data to save.", parent=self)
             return
-        data_utils.save_status(self.status_df) # Now saves to SQLite
+        if self._save_future is not None:
+            # Saves replace the whole table, so they must not overlap; save again once this one finishes.
+            self._save_requested_again = True
+            return
+
+        try:
+            df_to_save = data_utils.prepare_status_for_save(self.status_df)
+        except Exception as e:
+            data_utils.show_save_status_result(e)
+            return
+        self._save_future = self._executor.submit(data_utils.write_status_to_db, df_to_save) # Now saves to SQLite
+        self.after(50, self._poll_save)
+
+    def _poll_save(self):
+        """Checks the background save every 50 ms and reports the result once it is done."""
+        future = self._save_future
+        if future is None:
+            return
+        if not future.done():
+            self.after(50, self._poll_save)
+            return
+
+        self._save_future = None
+        data_utils.show_save_status_result(future.exception())
+
+        if self._save_requested_again:
+            self._save_requested_again = False
+            self.save_current_data()
+
+    def save_current_data_blocking(self):
+        """
+        Saves the current status_df synchronously, waiting for any background save first (used on exit).
+        Only failures are reported, since the window closes right after a successful save.
+
+        Returns:
+            bool: True if the data was saved (or there was nothing to save), False otherwise.
+        """
+        if self._save_future is not None:
+            self._save_future.exception() # Blocks until the in-flight write has finished
+            self._save_future = None
+        if self.status_df is None:
+            return True
+        try:
+            data_utils.write_status_to_db(data_utils.prepare_status_for_save(self.status_df))
+        except Exception as e:
+            data_utils.show_save_status_result(e)
+            return False
+        return True
 
     # REMOVED: generate_excel_report(self) method
 
@@ -253,7 +380,17 @@ class OpenJobsApp(tk.Tk):
                 if column_name in ['Order Date', 'Turn in Date']:
                     new_value = pd.to_datetime(new_value, errors='coerce') # Coerce to NaT if unparseable
 
-                self.status_df.loc[df_row_index, column_name] = new_value
+                column = self.status_df[column_name]
+                if isinstance(column.dtype, pd.CategoricalDtype) and pd.notna(new_value) \
+                        and new_value not in column.cat.categories:
+                    # Categoricals reject unknown values, so register the new one first (e.g. 'Status').
+                    # Categories stay sorted (as data_utils.apply_status_dtype builds them), since the
+                    # reporting counts rely on category order being alphabetical.
+                    self.status_df[column_name] = column.cat.set_categories(
+                        sorted([*column.cat.categories, new_value], key=str))
+
+                # Scalar setter: the index labels are the Treeview iids (never reset), so .at is used rather than .iat
+                self.status_df.at[df_row_index, column_name] = new_value
                 logging.info(f"AppShell: Data updated for index {df_row_index}, column '{column_name}'.")
             else:
                 logging.error(f"AppShell: Invalid index {df_row_index} or DataFrame not loaded for update.")
@@ -269,8 +406,9 @@ class OpenJobsApp(tk.Tk):
                 logging.warning("AppShell: No valid indices found for deletion.")
                 return
 
+            # The index is kept as-is (no reset_index): it doubles as the Treeview iid of each row,
+            # so the remaining rows keep their identity and the tree can drop just the deleted items.
             self.status_df.drop(index=valid_indices, inplace=True)
-            self.status_df.reset_index(drop=True, inplace=True)
             logging.info(f"AppShell: Deleted rows with original indices: {valid_indices}")
         else:
             logging.warning("AppShell: No data to delete or DataFrame not loaded.")
@@ -298,11 +436,13 @@ class OpenJobsApp(tk.Tk):
             parent=self
         )
         
-        if user_choice is True:
-            self.save_current_data() # Saves to SQLite
-            self.destroy()
-        elif user_choice is False:
-            self.destroy()
+        if user_choice is None:
+            return
+        if user_choice is True and not self.save_current_data_blocking(): # Runs in the foreground; the window is about to close
+            return # Keep the app open so unsaved changes are not lost
+        # Don't start queued background work; a read that is already running is simply discarded.
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
 
 if __name__ == '__main__':
     app = OpenJobsApp()
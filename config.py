@@ -2,7 +2,7 @@
 # This file contains application-wide configurations and constants.
 
 import logging
-LOG_LEVEL = logging.DEBUG
+LOG_LEVEL = logging.INFO
 
 # --- Application File Names ---
 # OUTPUT_FILE = "open_invoices.xlsx"  # Default for generated Excel report (REMOVED as per plan)
@@ -70,7 +70,7 @@ STATUS_COLORS = {
 }
 
 # --- Logging Configuration ---
-LOG_LEVEL = logging.DEBUG  # DEBUG, INFO, WARNING, ERROR, CRITICAL
+LOG_LEVEL = logging.INFO  # DEBUG, INFO, WARNING, ERROR, CRITICAL
 LOG_FORMAT = '%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s'
 
 # --- Reporting Tab UI ---
@@ -6,9 +6,11 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox, StringVar # Ensure StringVar is imported for dynamic UI text
+import numpy as np
 import pandas as pd
 import logging
 
+import data_utils # For shared column conversions (to_datetime_column)
 import config # For accessing configurations like column names, colors, etc.
 
 class DataManagementTab(ttk.Frame):
@@ -17,6 +19,21 @@ class DataManagementTab(ttk.Frame):
     This includes the Treeview display of job data, editing popups,
     and row styling based on status.
     """
+    # Status categories for row coloring (see STATUS_STYLES and _compute_row_styles)
+    ACTION_STATUSES = frozenset(["Ready to order", "Permit", "Waiting Measure"])
+    GOOD_STATUSES = frozenset(["Ready to dispatch", "In install", "Done", "Waiting for materials"])
+    # Status -> row style tag (see _configure_row_style_tags); any other status uses "default_status_style"
+    STATUS_STYLES = {
+        **dict.fromkeys(ACTION_STATUSES, "action_needed_style"),
+        **dict.fromkeys(GOOD_STATUSES, "all_good_style"),
+        "New": "new_style",
+        "Closed": "closed_style",
+        "Cancelled/Postponed": "closed_style",
+        config.REVIEW_MISSING_STATUS: "review_missing_style",
+    }
+    # Columns displayed with config.DATE_FORMAT
+    DATE_COLUMNS = ('Order Date', 'Turn in Date')
+
     def __init__(self, parent_notebook, app_instance):
         """
         Initialize the DataManagementTab.
@@ -29,20 +46,51 @@ class DataManagementTab(ttk.Frame):
         self.app = app_instance  # Store a reference to the main app
         self.tree = None         # Treeview widget will be initialized in _setup_ui
         self.editing_window = None # To manage the pop-up editor window, ensuring only one is open at a time
+        self._dirty_rows = set() # iids whose row style must be re-applied at the next idle (see _schedule_refresh)
+        self._row_styles = {} # Treeview iid -> row style tag, precomputed per data load (see _compute_row_styles)
+        self._applied_styles = {} # Treeview iid -> style tag currently set on the item
+        self._fmt_cache = {} # Column name -> display-formatted Series for _fmt_cache_source (see _get_formatted_column)
+        self._fmt_cache_source = None # The status_df the formatted columns were built from
+        self._sort_reverse = {} # Column name -> direction of that column's next heading-click sort
+        self._widths_set = False # True once the column widths have been applied (see set_column_widths_from_preferred)
+        self._scroll_delta = {"x": 0.0, "y": 0.0} # Wheel units accumulated per axis since the last scroll flush (see _on_mouse_wheel)
+        self._scroll_pending = False # True while a coalesced scroll is queued
+        self._cache_column_layout() # Column tuple, name->position map, widths and formatters
 
         self._setup_ui() # Build the user interface for this tab
 
+    def _cache_column_layout(self):
+        """
+        Caches everything derived from config.EXPECTED_COLUMNS, so it is built once per
+        schema instead of on every refresh or edit (see configure_treeview_columns).
+        """
+        self._columns = tuple(config.EXPECTED_COLUMNS)
+        self._column_index = {col: i for i, col in enumerate(self._columns)} # Column name -> Treeview position
+        # Final (clamped) pixel width per column, computed once from config rather than per refresh
+        self._column_widths = self._compute_column_widths()
+        self._fmt_cache = {} # Formatted columns are rebuilt for the new schema
+
+    @staticmethod
+    def _compute_column_widths():
+        """
+        Resolves the display width of every column in a single pass over config.EXPECTED_COLUMNS.
+        Preferred widths are clamped to [MIN_COLUMN_WIDTH, MAX_COLUMN_WIDTH].
+        Returns:
+            dict: Column name -> width in pixels.
+        """
+        return {
+            col: min(config.MAX_COLUMN_WIDTH,
+                     max(config.MIN_COLUMN_WIDTH, int(config.PREFERRED_COLUMN_WIDTHS.get(col, 100))))
+            for col in config.EXPECTED_COLUMNS
+        }
+
     def _setup_ui(self):
         """Creates and configures the widgets for this tab."""
         # Main Treeview widget to display the job data
-        self.tree = ttk.Treeview(self, columns=config.EXPECTED_COLUMNS, show="headings")
+        self.tree = ttk.Treeview(self, columns=self._columns, show="headings")
         
-        # Configure each column in the Treeview
-        for col in config.EXPECTED_COLUMNS:
-            # Set column heading text and enable sorting when a heading is clicked
-            self.tree.heading(col, text=col, command=lambda _col=col: self.sort_treeview_column(_col, False))
-            # Set default width and alignment for each column
-            self.tree.column(col, width=config.PREFERRED_COLUMN_WIDTHS.get(col, 100), anchor=tk.W)
+        # Configure each column's heading, sort command, width and alignment
+        self.set_column_widths_from_preferred(force=True)
 
         # Scrollbars for the Treeview (vertical and horizontal)
         vsb = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
@@ -61,24 +109,96 @@ class DataManagementTab(ttk.Frame):
         # Bind events to Treeview actions
         self.tree.bind("<Double-1>", self.on_double_click) # Double-click to edit a cell
         self.tree.bind("<Delete>", self.handle_delete_key) # Delete key to remove selected row(s)
+        # Mouse wheel: coalesce bursts of wheel events into one scroll per idle cycle
+        self.tree.bind("<MouseWheel>", self._on_mouse_wheel) # Windows / macOS
+        self.tree.bind("<Button-4>", self._on_mouse_wheel)   # Linux (X11) scroll up
+        self.tree.bind("<Button-5>", self._on_mouse_wheel)   # Linux (X11) scroll down
+        # Shift+wheel scrolls horizontally, as in Tk's default Treeview bindings
+        self.tree.bind("<Shift-MouseWheel>", lambda event: self._on_mouse_wheel(event, axis="x"))
+        self.tree.bind("<Shift-Button-4>", lambda event: self._on_mouse_wheel(event, axis="x"))
+        self.tree.bind("<Shift-Button-5>", lambda event: self._on_mouse_wheel(event, axis="x"))
+
+        self._configure_row_style_tags() # Row colors only need to be defined once per widget
+
+    def _on_mouse_wheel(self, event, axis="y"):
+        """
+        Accumulates mouse wheel motion and schedules a single xview/yview scroll for the next idle
+        cycle, so a fast wheel burst re-lays out the Treeview once rather than once per tick.
+        Units per event follow Tk's default bindings: -delta/120 on Windows, -delta on macOS,
+        one unit per button press on X11.
+        """
+        if event.num == 4:
+            units = -1
+        elif event.num == 5:
+            units = 1
+        elif event.delta:
+            if self.tk.call("tk", "windowingsystem") == "aqua":
+                units = -event.delta # macOS deltas are already in scroll units
+            else:
+                units = -event.delta / 120 # Windows reports 120 per notch (less on high-resolution wheels)
+        else:
+            return "break"
+
+        self._scroll_delta[axis] += units
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            self.after_idle(self._flush_scroll)
+        return "break" # Skip the default per-event Treeview scrolling
+
+    def _flush_scroll(self):
+        """Applies the wheel motion accumulated by _on_mouse_wheel, one scroll per axis."""
+        self._scroll_pending = False
+        if not self.tree: return
+        for axis, scroll in (("x", self.tree.xview_scroll), ("y", self.tree.yview_scroll)):
+            # Whole units are scrolled now; a fractional remainder (high-resolution wheels) carries over
+            whole_units = int(self._scroll_delta[axis])
+            self._scroll_delta[axis] -= whole_units
+            if whole_units:
+                scroll(whole_units, "units")
+
+    def _configure_row_style_tags(self):
+        """Defines the Treeview row style tags (see _compute_row_styles), using colors from config.STATUS_COLORS."""
+        styles_map = {
+            "default_status_style": (config.STATUS_COLORS["default_bg"], config.STATUS_COLORS["default_fg"]),
+            "action_needed_style": (config.STATUS_COLORS["action_needed_bg"], config.STATUS_COLORS["action_needed_fg"]),
+            "all_good_style": (config.STATUS_COLORS["all_good_bg"], config.STATUS_COLORS["all_good_fg"]),
+            "closed_style": (config.STATUS_COLORS["closed_bg"], config.STATUS_COLORS["closed_fg"]),
+            "new_style": (config.STATUS_COLORS["new_bg"], config.STATUS_COLORS["new_fg"]),
+            "review_missing_style": (config.STATUS_COLORS["review_missing_bg"], config.STATUS_COLORS["review_missing_fg"])
+        }
+        for tag_name, (bg, fg) in styles_map.items():
+            self.tree.tag_configure(tag_name, background=bg, foreground=fg)
+
+    def _apply_column_layout(self):
+        """
+        Sets every column's heading text, sort command, width and anchor.
+        Headings sort ascending on the next click.
+        """
+        for col in self._columns:
+            # Set column heading text and enable sorting when a heading is clicked
+            self.tree.heading(col, text=col, command=lambda _col=col: self._on_heading_click(_col))
+            # Set default width and alignment for each column
+            self.tree.column(col, width=self._column_widths[col], anchor=tk.W)
+        self._sort_reverse = {}
+
+    def _on_heading_click(self, col):
+        """Sorts by the clicked column, alternating ascending/descending on repeated clicks."""
+        self.sort_treeview_column(col, self._sort_reverse.get(col, False))
 
     def configure_treeview_columns(self):
         """
         Ensures the Treeview columns match the current config.EXPECTED_COLUMNS.
         This can be useful if the expected columns change dynamically or need refreshing.
+        The columns are reconfigured in place, and only when they actually differ, so
+        existing items, bindings and tags are left untouched on a routine refresh.
         """
         if not self.tree: return # Safety check
-        current_tree_cols = list(config.EXPECTED_COLUMNS)
-        self.tree.configure(columns=current_tree_cols) # Update the columns definition
-        for col in current_tree_cols:
-            # Re-apply heading text and sort command
-            self.tree.heading(col, text=col, command=lambda _col=col: self.sort_treeview_column(_col, False))
-            # Re-apply column width and anchor
-            self.tree.column(col, width=config.PREFERRED_COLUMN_WIDTHS.get(col, 100), anchor=tk.W)
-        
-        # Hide the default first column ('#0') if it's present and not already hidden
-        if '#0' in self.tree.column('#0'): 
-            self.tree.column('#0', width=0, stretch=tk.NO)
+        if tuple(config.EXPECTED_COLUMNS) == self._columns:
+            return # Schema unchanged; headings and widths are already in place
+        self._cache_column_layout()
+        self.tree.configure(columns=self._columns) # Update the columns definition
+        # Re-apply headings, sort commands, column widths and anchors for the new schema
+        self.set_column_widths_from_preferred(force=True)
 
     def populate_treeview(self):
         """
@@ -89,46 +209,114 @@ class DataManagementTab(ttk.Frame):
             logging.warning("DMT: populate_treeview called but tree is not initialized.")
             return
         
-        # Clear existing items from the Treeview
-        for i in self.tree.get_children():
-            self.tree.delete(i)
+        # Clear existing items from the Treeview in a single Tcl call
+        self.tree.delete(*self.tree.get_children())
+        self._applied_styles = {}
 
         # If no data is loaded in the app, nothing to show
         if self.app.status_df is None or self.app.status_df.empty:
             logging.info("DataManagementTab: No data to populate in the treeview.")
             return
 
-        # Ensure the DataFrame columns are in the expected order for display
-        display_df = self.app.status_df.reindex(columns=config.EXPECTED_COLUMNS)
-        date_columns = ['Order Date', 'Turn in Date'] # Columns that need date formatting
-
-        # Iterate through each row in the DataFrame and insert it into the Treeview
-        for df_index, row in display_df.iterrows(): 
-            values = [] # List to hold formatted values for the current row
-            for col_name in config.EXPECTED_COLUMNS:
-                value = row[col_name]
-                # Apply specific formatting for date and currency columns
-                if col_name in date_columns and pd.notna(value):
-                    try: 
-                        # Date formatting now uses the updated config.DATE_FORMAT (e.g., '%Y-%m-%d')
-                        value = pd.to_datetime(value).strftime(config.DATE_FORMAT)
-                    except (ValueError, TypeError): logging.warning(f"DMT: Could not format date for '{value}' in col '{col_name}'. Original used.")
-                elif col_name in config.CURRENCY_COLUMNS and pd.notna(value):
-                    try:
-                        # Convert to float then format as currency
-                        num_value = float(str(value).replace('$', '').replace(',', ''))
-                        value = config.CURRENCY_FORMAT.format(num_value)
-                    except (ValueError, TypeError): logging.warning(f"DMT: Could not format currency for '{value}' in col '{col_name}'. Original used.")
-                
-                # Use empty string for NaN/None values in display
-                values.append(value if pd.notna(value) else "")
-            
-            # Insert the row into the Treeview. The original DataFrame index is stored as a tag.
-            self.tree.insert("", tk.END, values=tuple(values), tags=(str(df_index),)) 
+        # Format every column for display up front (column-wise), so the insert loop does no per-cell work
+        display_df = self._build_display_frame()
+        # Row styles are known before inserting, so each row gets its final tag in the insert itself
+        self._compute_row_styles()
+        row_styles = self._row_styles
+
+        # Iterate over plain tuples (itertuples) rather than iterrows, which builds a Series per row
+        for item_id, values in zip(display_df.index.astype(str), display_df.itertuples(index=False, name=None)):
+            # Insert the row into the Treeview. The original DataFrame index is used as the item's iid,
+            # so handlers map items back to rows directly and the style tag is the item's only tag.
+            style_tag = row_styles.get(item_id, "default_status_style")
+            self.tree.insert("", tk.END, iid=item_id, values=values, tags=(style_tag,))
+            self._applied_styles[item_id] = style_tag
+
+    def _build_display_frame(self):
+        """
+        Returns app.status_df in Treeview column order with every cell formatted as display text,
+        assembled from the per-column cache (see _get_formatted_column).
+        """
+        df = self.app.status_df
+        if self._fmt_cache_source is not df:
+            # A different DataFrame (new load) invalidates every cached column
+            self._fmt_cache = {}
+            self._fmt_cache_source = df
+        return pd.DataFrame({col_name: self._get_formatted_column(col_name) for col_name in self._columns},
+                            index=df.index)
+
+    def _get_formatted_column(self, col_name):
+        """
+        Returns the display text of one column of app.status_df, formatting it only if it is not cached.
+        Dates use config.DATE_FORMAT, currency columns config.CURRENCY_FORMAT, and
+        NaN/None values become an empty string. The whole column is formatted at once.
+        Edits drop their column from the cache and deletes drop their rows (see _save_edited_data
+        and handle_delete_key), so unchanged columns are never reformatted for the same data.
+        """
+        formatted = self._fmt_cache.get(col_name)
+        if formatted is not None:
+            return formatted
 
-        # Adjust column widths after data is populated (deferred for accurate calculation)
-        self.app.after(10, self.set_column_widths_from_preferred) 
-        self.color_rows() # Apply row styling based on status
+        df = self.app.status_df
+        if col_name in df.columns:
+            series = df[col_name]
+        else:
+            series = pd.Series(None, index=df.index, dtype=object, name=col_name)
+
+        if col_name in self.DATE_COLUMNS:
+            formatted = self._format_date_column(series)
+        elif col_name in config.CURRENCY_COLUMNS:
+            formatted = self._format_currency_column(series)
+        else:
+            # astype(object) first, since a categorical column (Status) rejects "" as a fill value
+            formatted = series.astype(object).where(series.notna(), "").astype(str)
+        self._fmt_cache[col_name] = formatted
+        return formatted
+
+    @staticmethod
+    def _format_date_column(series):
+        """
+        Formats a whole date column with config.DATE_FORMAT for display.
+        NaN/NaT become an empty string; values that cannot be parsed as a date are shown as-is.
+        """
+        present = series.notna()
+        dates = data_utils.to_datetime_column(series) # Skips parsing when the column is already datetime64
+        parsed = present & dates.notna()
+
+        formatted = pd.Series("", index=series.index, dtype=object)
+        formatted[parsed] = dates[parsed].dt.strftime(config.DATE_FORMAT)
+        unparsed = present & ~parsed
+        if unparsed.any():
+            logging.warning(f"DMT: Could not format date for {int(unparsed.sum())} value(s) in col '{series.name}'. Original used.")
+            formatted[unparsed] = series[unparsed].astype(str)
+        return formatted
+
+    @staticmethod
+    def _format_currency_column(series):
+        """
+        Formats a whole currency column with config.CURRENCY_FORMAT for display.
+        NaN/None become an empty string; values that cannot be parsed as a number are shown as-is.
+        """
+        present = series.notna().to_numpy()
+        if pd.api.types.is_numeric_dtype(series):
+            numbers = series.to_numpy(dtype=float, na_value=np.nan)
+        else:
+            numbers = pd.to_numeric(series, errors='coerce').to_numpy(dtype=float, na_value=np.nan, copy=True)
+            # Only values that are not plain numbers (e.g. "$1,200.00") go through the regex clean-up
+            needs_cleanup = present & np.isnan(numbers)
+            if needs_cleanup.any():
+                cleaned = series[needs_cleanup].astype(str).str.replace(r'[$,]', '', regex=True)
+                numbers[needs_cleanup] = pd.to_numeric(cleaned, errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+        parsed = present & ~np.isnan(numbers)
+
+        format_currency = config.CURRENCY_FORMAT.format # Bound once; called directly per parsed value
+        formatted = np.full(len(series), "", dtype=object)
+        formatted[parsed] = [format_currency(number) for number in numbers[parsed]]
+        unparsed = present & ~parsed
+        if unparsed.any():
+            logging.warning(f"DMT: Could not format currency for {int(unparsed.sum())} value(s) in col '{series.name}'. Original used.")
+            formatted[unparsed] = series[unparsed].astype(str).to_numpy()
+        return pd.Series(formatted, index=series.index, name=series.name)
 
     def on_double_click(self, event):
         """
@@ -146,17 +334,12 @@ class DataManagementTab(ttk.Frame):
         try:
             # Convert column identifier to an index and get the column name
             column_index_tree = int(column_id_str.replace("#", "")) - 1 # Treeview columns are 1-indexed
-            if not (0 <= column_index_tree < len(config.EXPECTED_COLUMNS)):
+            if not (0 <= column_index_tree < len(self._columns)):
                 logging.warning(f"DMT: Invalid column index from tree: {column_index_tree}")
                 return
-            actual_column_name = config.EXPECTED_COLUMNS[column_index_tree]
+            actual_column_name = self._columns[column_index_tree]
             
-            # Retrieve the original DataFrame index stored in the item's tags
-            tags = self.tree.item(item_id, "tags")
-            if not tags:
-                logging.error(f"DMT: Item {item_id} has no tags (df_index missing). Cannot edit.")
-                return
-            df_row_index = int(tags[0]) # The first tag is assumed to be the DataFrame index
+            df_row_index = int(item_id) # Items are inserted with the DataFrame index as their iid
 
             # Close any existing editor window before opening a new one
             if self.editing_window and self.editing_window.winfo_exists():
@@ -172,7 +355,7 @@ class DataManagementTab(ttk.Frame):
                 self.create_pc_editor(item_id, df_row_index, actual_column_name)
             else:
                 # For other columns, no special editor is defined (they are not user-editable this way)
-                logging.debug(f"DMT: No special editor for column '{actual_column_name}'.")
+                logging.debug("DMT: No special editor for column '%s'.", actual_column_name)
         except (ValueError, IndexError, TypeError) as e:
             logging.error(f"DMT: Error in on_double_click: {e}. ItemID: {item_id}, ColIDStr: {column_id_str}", exc_info=True)
 
@@ -191,10 +374,6 @@ class DataManagementTab(ttk.Frame):
             # Update the underlying DataFrame in the main application
             self.app.perform_data_update(df_row_index, column_name, new_value)
             
-            # Update the value displayed in the Treeview
-            current_tree_values = list(self.tree.item(item_id, "values"))
-            column_tree_idx = config.EXPECTED_COLUMNS.index(column_name) # Get Treeview column index
-            
             # Format the value for display if necessary (currency, date)
             display_value = new_value 
             if column_name in config.CURRENCY_COLUMNS and pd.notna(new_value):
@@ -207,12 +386,16 @@ class DataManagementTab(ttk.Frame):
                     display_value = pd.to_datetime(new_value).strftime(config.DATE_FORMAT)
                 except: pass
             
-            current_tree_values[column_tree_idx] = display_value if pd.notna(display_value) else ""
-            self.tree.item(item_id, values=tuple(current_tree_values))
+            # Update just the edited cell in the Treeview (no read/rewrite of the whole row's values)
+            self.tree.set(item_id, column=column_name, value=display_value if pd.notna(display_value) else "")
+
+            if column_name == "Status":
+                self._row_styles[item_id] = self._style_for_status(new_value)
+            self._fmt_cache.pop(column_name, None) # Only the edited column needs reformatting on the next populate
 
             editor_window.destroy() # Close the editor popup
             self.editing_window = None
-            self.color_rows() # Re-apply row styling as status might have changed
+            self._schedule_refresh(item_id) # Re-apply this row's styling (status might have changed) once the UI is idle
             self.app.notify_data_changed() # Inform other parts of the app (like Reporting tab)
         except Exception as e:
             logging.error(f"DMT: Error in _save_edited_data for column '{column_name}': {e}", exc_info=True)
@@ -381,14 +564,11 @@ class DataManagementTab(ttk.Frame):
         if not messagebox.askyesno("Confirm Delete", confirm_msg, parent=self.app):
             return
 
-        # Collect DataFrame indices of rows to be deleted
+        # Collect DataFrame indices of rows to be deleted (each item's iid is its DataFrame index)
         df_indices_to_delete = []
         for item_id in selected_tree_items:
-            tags = self.tree.item(item_id, "tags") # Get DataFrame index from tags
-            if tags:
-                try: df_indices_to_delete.append(int(tags[0]))
-                except ValueError: logging.warning(f"DMT: Invalid tag for df_index on item {item_id}: {tags[0]}")
-            else: logging.warning(f"DMT: Item {item_id} has no df_index tag. Cannot delete.")
+            try: df_indices_to_delete.append(int(item_id))
+            except ValueError: logging.warning(f"DMT: Item iid {item_id} is not a DataFrame index. Cannot delete.")
         
         if not df_indices_to_delete:
             messagebox.showwarning("Deletion Error", "Could not identify valid rows to delete.", parent=self.app)
@@ -396,92 +576,88 @@ class DataManagementTab(ttk.Frame):
 
         # Perform deletion in the main application's DataFrame
         self.app.perform_delete_rows(df_indices_to_delete)
-        self.populate_treeview() # Refresh the Treeview to reflect deletions
+        # DataFrame indices stay stable across deletes, so only the deleted items are removed from the Treeview
+        deleted_iids = [str(df_index) for df_index in df_indices_to_delete]
+        for item_id in deleted_iids:
+            self._row_styles.pop(item_id, None)
+            self._applied_styles.pop(item_id, None)
+        # Cached formatted columns share the DataFrame index, so the deleted rows are simply dropped from them
+        self._fmt_cache = {col_name: formatted.drop(index=df_indices_to_delete, errors='ignore')
+                           for col_name, formatted in self._fmt_cache.items()}
+        self.tree.delete(*deleted_iids)
         messagebox.showinfo("Success", f"{len(df_indices_to_delete)} row(s) deleted.", parent=self.app)
         self.app.notify_data_changed() # Notify other parts of the application
 
-    def set_column_widths_from_preferred(self):
+    def _schedule_refresh(self, item_id):
         """
-        Adjusts Treeview column widths based on preferred settings in config.
-        Ensures widths are within min/max bounds.
-        Called after data population for better accuracy.
+        Queues a row-style refresh of one edited row for when Tk is idle.
+        Repeated calls before the refresh runs are coalesced into one pass over the edited rows.
         """
+        if not self._dirty_rows:
+            self.after_idle(self._do_refresh)
+        self._dirty_rows.add(item_id)
+
+    def _do_refresh(self):
+        """Runs the refresh queued by _schedule_refresh, restyling only the rows that were edited."""
+        dirty_rows, self._dirty_rows = self._dirty_rows, set()
         if not self.tree: return
-        self.app.update_idletasks() # Ensure Tkinter has processed pending geometry changes
-        for col_name in config.EXPECTED_COLUMNS:
-            if col_name == '#0': continue # Skip the hidden default column
-            
-            # Get preferred width, apply min/max constraints
-            width = config.PREFERRED_COLUMN_WIDTHS.get(col_name, 100) # Default if not specified
-            final_width = max(config.MIN_COLUMN_WIDTH, int(width))
-            final_width = min(config.MAX_COLUMN_WIDTH, int(final_width))
-            self.tree.column(col_name, width=final_width, anchor=tk.W)
-            
+        for item_id in dirty_rows:
+            if self.tree.exists(item_id): # The row may have been deleted or reloaded meanwhile
+                self._color_row(item_id)
+
+    def set_column_widths_from_preferred(self, force=False):
+        """
+        Adjusts Treeview column widths (and headings) based on preferred settings in config.
+        Widths are pre-clamped to min/max bounds in _compute_column_widths, so this
+        only applies them; it does not need to inspect tree items or force a layout pass.
+        The widths do not depend on the data, so they are applied once; later calls
+        are no-ops unless force is True (used after a column schema change).
+        Args:
+            force (bool): Re-apply the widths even if they were already set.
+        """
+        if not self.tree: return
+        if self._widths_set and not force: return
+        self._apply_column_layout() # Widths are applied together with the headings
+
         # Explicitly hide column #0 if it exists and isn't already hidden
         if '#0' in self.tree['columns'] and self.tree.column('#0', 'width') != 0 :
              self.tree.column('#0', width=0, stretch=tk.NO)
+        self._widths_set = True
 
-    def color_rows(self):
+    @classmethod
+    def _style_for_status(cls, status):
+        """Returns the row style tag (see _configure_row_style_tags) for a 'Status' value."""
+        return cls.STATUS_STYLES.get(status, "default_status_style") # Includes blank/unknown statuses
+
+    def _compute_row_styles(self):
         """
-        Applies background and foreground colors to Treeview rows based on their 'Status'.
-        Uses color settings from config.STATUS_COLORS.
+        Precomputes the style tag of every row from the 'Status' column of status_df,
+        keyed by Treeview iid (the DataFrame index as a string). Run once per data load;
+        single edits update their own entry in _save_edited_data.
         """
-        if not self.tree or self.app.status_df is None or self.app.status_df.empty: return
-
-        # Define styles (tags) for different statuses using colors from config
-        styles_map = {
-            "default_status_style": (config.STATUS_COLORS["default_bg"], config.STATUS_COLORS["default_fg"]),
-            "action_needed_style": (config.STATUS_COLORS["action_needed_bg"], config.STATUS_COLORS["action_needed_fg"]),
-            "all_good_style": (config.STATUS_COLORS["all_good_bg"], config.STATUS_COLORS["all_good_fg"]),
-            "closed_style": (config.STATUS_COLORS["closed_bg"], config.STATUS_COLORS["closed_fg"]),
-            "new_style": (config.STATUS_COLORS["new_bg"], config.STATUS_COLORS["new_fg"]),
-            "review_missing_style": (config.STATUS_COLORS["review_missing_bg"], config.STATUS_COLORS["review_missing_fg"])
-        }
-        for tag_name, (bg, fg) in styles_map.items():
-            self.tree.tag_configure(tag_name, background=bg, foreground=fg)
-
-        # Status categories for coloring
-        action_statuses = ["Ready to order", "Permit", "Waiting Measure"] 
-        good_statuses = ["Ready to dispatch", "In install", "Done", "Waiting for materials"]
-        status_col_name = "Status" 
-        
-        try: 
-            # Get the index of the 'Status' column in the Treeview
-            status_column_tree_index = config.EXPECTED_COLUMNS.index(status_col_name)
-        except ValueError:
-            logging.error(f"DMT: '{status_col_name}' column not found in EXPECTED_COLUMNS. Cannot color rows.")
+        df = self.app.status_df
+        if df is None or "Status" not in df.columns:
+            self._row_styles = {}
             return
-
-        # Iterate over each row in the Treeview and apply the appropriate style tag
-        for item_id in self.tree.get_children():
-            try:
-                # Preserve the original DataFrame index tag
-                df_index_tag_list = self.tree.item(item_id, "tags")
-                df_index_tag = df_index_tag_list[0] if df_index_tag_list else f"err_idx_{item_id}" # Fallback tag
-                new_tags_for_item = [df_index_tag] # Start with the df_index tag
-
-                # Get the status value from the Treeview row
-                values = self.tree.item(item_id, "values")
-                if values and len(values) > status_column_tree_index:
-                    status = str(values[status_column_tree_index])
-                    # Append the corresponding style tag based on status
-                    if status == "New": new_tags_for_item.append("new_style")
-                    elif status == "Closed" or status == "Cancelled/Postponed": new_tags_for_item.append("closed_style")
-                    elif status == config.REVIEW_MISSING_STATUS: new_tags_for_item.append("review_missing_style")
-                    elif status in action_statuses: new_tags_for_item.append("action_needed_style")
-                    elif status in good_statuses: new_tags_for_item.append("all_good_style")
-                    else: new_tags_for_item.append("default_status_style")
-                else:
-                    # If status can't be determined, apply default style
-                    new_tags_for_item.append("default_status_style")
-                
-                # Set the combined tags for the item (df_index + style_tag)
-                self.tree.item(item_id, tags=tuple(new_tags_for_item))
-            except Exception as e:
-                # Log error and apply a fallback style to prevent crashes
-                logging.error(f"DMT: Error coloring row {item_id}: {e}", exc_info=True)
-                df_idx_tag_fallback = self.tree.item(item_id,"tags")[0] if self.tree.item(item_id,"tags") else f"err_idx_fb_{item_id}"
-                self.tree.item(item_id, tags=(df_idx_tag_fallback, "default_status_style"))
+        statuses = df["Status"]
+        if isinstance(statuses.dtype, pd.CategoricalDtype):
+            # One style per category, then a single take by integer code; code -1 (missing)
+            # picks the trailing default entry.
+            category_styles = np.array([self._style_for_status(status) for status in statuses.cat.categories]
+                                       + ["default_status_style"], dtype=object)
+            styles = category_styles[statuses.cat.codes.to_numpy()]
+        else:
+            # Series.map looks each status up in STATUS_STYLES
+            styles = statuses.map(self.STATUS_STYLES).astype(object).fillna("default_status_style")
+        self._row_styles = dict(zip(df.index.astype(str), styles))
+
+    def _color_row(self, item_id):
+        """Sets a single row's style tag, skipping the Tcl call if the item already has it."""
+        style_tag = self._row_styles.get(item_id, "default_status_style")
+        if self._applied_styles.get(item_id) != style_tag:
+            # Row identity lives in the iid, so the style tag is the item's only tag
+            self.tree.item(item_id, tags=(style_tag,))
+            self._applied_styles[item_id] = style_tag
 
     def sort_treeview_column(self, col, reverse):
         """
@@ -500,38 +676,31 @@ class DataManagementTab(ttk.Frame):
             items_to_sort = []
             for item_id in self.tree.get_children(''):
                 sort_value = None
-                tags = self.tree.item(item_id, "tags") # Get DataFrame index
-                
-                if not tags: 
-                    # Fallback: if no df_index tag, sort by the displayed value (less accurate for some types)
-                    logging.warning(f"DMT: Cannot sort item {item_id}, missing df_index tag. Using displayed value.")
+                try:
+                    df_index = int(item_id) # Items are inserted with the DataFrame index as their iid
+                    if df_index not in self.app.status_df.index: 
+                         # Fallback if df_index is invalid
+                         logging.warning(f"DMT: Invalid df_index {df_index} for item {item_id} during sort. Using displayed value.")
+                         sort_value = self.tree.set(item_id, col)
+                    else:
+                        # Get the original value from the DataFrame for accurate sorting
+                        original_value = self.app.status_df.loc[df_index, col]
+                        
+                        # Convert to appropriate type for sorting
+                        if col in date_columns:
+                            # Sorting will use full datetime objects
+                            sort_value = pd.to_datetime(original_value, errors='coerce') 
+                        elif col in config.CURRENCY_COLUMNS:
+                            try: 
+                                sort_value = float(str(original_value).replace('$', '').replace(',', ''))
+                            except (ValueError, TypeError): sort_value = str(original_value) # Fallback to string sort
+                        else: # For other columns, try numeric then string
+                            try: sort_value = float(original_value)
+                            except (ValueError, TypeError): sort_value = str(original_value)
+                except (IndexError, KeyError, ValueError, TypeError) as e:
+                    # General fallback for any error during value retrieval/conversion
+                    logging.warning(f"DMT: Sort fallback for col {col}, item {item_id}: {e}. Using displayed value.")
                     sort_value = self.tree.set(item_id, col) 
-                else:
-                    try:
-                        df_index = int(tags[0])
-                        if df_index not in self.app.status_df.index: 
-                             # Fallback if df_index is invalid
-                             logging.warning(f"DMT: Invalid df_index {df_index} for item {item_id} during sort. Using displayed value.")
-                             sort_value = self.tree.set(item_id, col)
-                        else:
-                            # Get the original value from the DataFrame for accurate sorting
-                            original_value = self.app.status_df.loc[df_index, col]
-                            
-                            # Convert to appropriate type for sorting
-                            if col in date_columns:
-                                # Sorting will use full datetime objects
-                                sort_value = pd.to_datetime(original_value, errors='coerce') 
-                            elif col in config.CURRENCY_COLUMNS:
-                                try: 
-                                    sort_value = float(str(original_value).replace('$', '').replace(',', ''))
-                                except (ValueError, TypeError): sort_value = str(original_value) # Fallback to string sort
-                            else: # For other columns, try numeric then string
-                                try: sort_value = float(original_value)
-                                except (ValueError, TypeError): sort_value = str(original_value)
-                    except (IndexError, KeyError, ValueError, TypeError) as e:
-                        # General fallback for any error during value retrieval/conversion
-                        logging.warning(f"DMT: Sort fallback for col {col}, item {item_id} (df_idx {tags[0]}): {e}. Using displayed value.")
-                        sort_value = self.tree.set(item_id, col) 
                 
                 items_to_sort.append((sort_value, item_id))
 
@@ -550,7 +719,7 @@ class DataManagementTab(ttk.Frame):
                 self.tree.move(item_id, '', index)
                 
             # Update the column heading to toggle sort direction on next click
-            self.tree.heading(col, command=lambda _col=col: self.sort_treeview_column(_col, not reverse))
+            self._sort_reverse[col] = not reverse
         except Exception as e:
             logging.error(f"DMT: Error sorting column {col}: {e}", exc_info=True)
 
@@ -561,13 +730,13 @@ class DataManagementTab(ttk.Frame):
         """
         logging.info("Data Management tab selected.")
         if self.tree: 
-            # If tree is empty but data exists, populate it (e.g., first time tab is shown after data load)
-            if not self.tree.get_children() and self.app.status_df is not None and not self.app.status_df.empty:
+            # If the tree was never filled for the current data, populate it (e.g., first time tab is shown after data load).
+            # _row_styles is rebuilt by every populate, so it is checked instead of listing all Treeview children.
+            if not self._row_styles and self.app.status_df is not None and not self.app.status_df.empty:
                 logging.info("Data Management tab was empty, populating treeview on selection.")
                 self.populate_treeview()
             else: 
-                # Otherwise, just ensure columns and widths are up-to-date
+                # Otherwise, only reconfigure if the column schema changed (this also re-applies the widths)
                 self.configure_treeview_columns()
-                self.set_column_widths_from_preferred()
         else:
             logging.warning("Data Management tab selected, but treeview not initialized.")
\ No newline at end of file
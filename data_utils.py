@@ -25,7 +25,7 @@ def _adjust_ambiguous_date_years(date_series: pd.Series, current_timestamp: pd.T
     """
     if not isinstance(date_series, pd.Series) or date_series.empty or not pd.api.types.is_datetime64_any_dtype(date_series):
         if isinstance(date_series, pd.Series) and not date_series.empty :
-             logging.debug(f"Series '{series_name}' is not of datetime type or is empty. Skipping year adjustment.")
+             logging.debug("Series '%s' is not of datetime type or is empty. Skipping year adjustment.", series_name)
         return date_series
 
     adjusted_series = date_series.copy()
@@ -40,9 +40,27 @@ def _adjust_ambiguous_date_years(date_series: pd.Series, current_timestamp: pd.T
     return adjusted_series
 
 
-def load_excel(excel_file_path: str) -> pd.DataFrame | None:
+def to_datetime_column(series: pd.Series) -> pd.Series:
     """
-    Loads data from an Excel file into a Pandas DataFrame.
+    Converts a column to datetime64, coercing unparseable values to NaT. A column that is
+    already datetime64 is returned unchanged, so repeated normalization passes cost nothing;
+    otherwise each distinct value is parsed only once (cache=True).
+
+    Args:
+        series (pd.Series): The column to convert.
+
+    Returns:
+        pd.Series: The column as datetime64.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    return pd.to_datetime(series, errors='coerce', cache=True)
+
+
+def read_excel_file(excel_file_path: str) -> pd.DataFrame | None:
+    """
+    Reads an Excel file into a Pandas DataFrame without any UI interaction, so it can
+    safely run on a worker thread (see OpenJobsApp.load_new_excel_data).
     Tries to read normally, and if key columns (like 'Invoice #') are missing,
     tries again skipping the first row, assuming it might be an extra title row.
     Adjusts year for date columns if they appear to be future dates from a yearless source.
@@ -51,67 +69,101 @@ def load_excel(excel_file_path: str) -> pd.DataFrame | None:
         excel_file_path (str): The path to the Excel file.
 
     Returns:
-        pd.DataFrame | None: A DataFrame containing the Excel data,
-                             or None if an error occurs during loading.
+        pd.DataFrame | None: A DataFrame containing the Excel data, or None if the
+                             'Invoice #' column could not be found.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        Exception: Any other error raised by pandas while reading the workbook.
     """
-    try:
-        logging.debug(f"Attempting to load Excel file from: {excel_file_path}")
-        df = pd.read_excel(excel_file_path)
-        logging.debug(f"LOAD_EXCEL: Raw columns from Excel (header=0 attempt): {df.columns.tolist()}") # <<< NEW DEBUG LOG
-        # logging.info(f"Successfully loaded Excel file (first attempt): {excel_file_path}") # Original info log
+    logging.debug("Attempting to load Excel file from: %s", excel_file_path)
+    df = pd.read_excel(excel_file_path)
+    logging.debug("LOAD_EXCEL: Raw columns from Excel (header=0 attempt): %s", df.columns.tolist()) # <<< NEW DEBUG LOG
+    # logging.info(f"Successfully loaded Excel file (first attempt): {excel_file_path}") # Original info log
 
+    df.columns = [str(col).strip() for col in df.columns]
+    
+    logging.debug("LOAD_EXCEL: Stripped columns from Excel (header=0 attempt): %s", df.columns.tolist()) # <<< REVISED DEBUG LOG (was DEBUG: Columns loaded from Excel (after stripping))
+    
+    # Using 'Invoice #' as per user feedback
+    if 'Invoice #' not in df.columns:
+        logging.warning(f"LOAD_EXCEL: Initial load missing 'Invoice #'. Trying header=1.") # <<< NEW DEBUG LOG
+        # logging.warning(f"Initial load of {excel_file_path} missing 'Invoice #' column. Assuming an extra header row and trying again (header=1).") # Original warning
+        df = pd.read_excel(excel_file_path, header=1)
+        logging.debug("LOAD_EXCEL: Raw columns from Excel (header=1 attempt): %s", df.columns.tolist()) # <<< NEW DEBUG LOG
         df.columns = [str(col).strip() for col in df.columns]
+        logging.debug("LOAD_EXCEL: Stripped columns from Excel (header=1 attempt): %s", df.columns.tolist()) # <<< REVISED DEBUG LOG (was DEBUG: Columns after attempting header=1 (after stripping))
         
-        logging.debug(f"LOAD_EXCEL: Stripped columns from Excel (header=0 attempt): {df.columns.tolist()}") # <<< REVISED DEBUG LOG (was DEBUG: Columns loaded from Excel (after stripping))
-        
-        # Using 'Invoice #' as per user feedback
         if 'Invoice #' not in df.columns:
-            logging.warning(f"LOAD_EXCEL: Initial load missing 'Invoice #'. Trying header=1.") # <<< NEW DEBUG LOG
-            # logging.warning(f"Initial load of {excel_file_path} missing 'Invoice #' column. Assuming an extra header row and trying again (header=1).") # Original warning
-            df = pd.read_excel(excel_file_path, header=1)
-            logging.debug(f"LOAD_EXCEL: Raw columns from Excel (header=1 attempt): {df.columns.tolist()}") # <<< NEW DEBUG LOG
-            df.columns = [str(col).strip() for col in df.columns]
-            logging.debug(f"LOAD_EXCEL: Stripped columns from Excel (header=1 attempt): {df.columns.tolist()}") # <<< REVISED DEBUG LOG (was DEBUG: Columns after attempting header=1 (after stripping))
-            
-            if 'Invoice #' not in df.columns:
-                 logging.error(f"LOAD_EXCEL: Failed to find 'Invoice #' column even after skipping the first row in {excel_file_path}.") # <<< REVISED DEBUG LOG
-                 # logging.error(f"Failed to find 'Invoice #' column even after skipping the first row in {excel_file_path}.") # Original error
-                 messagebox.showerror("Excel Load Error", 
-                                      f"Could not find the required 'Invoice #' column in the Excel file:\n{excel_file_path}\n\n"
-                                      "Please ensure the Excel sheet has a header row containing 'Invoice #' and other expected columns, "
-                                      "and that it's located in either the first or second row.")
-                 return None
-            else:
-                logging.info(f"LOAD_EXCEL: Successfully re-loaded Excel file {excel_file_path} with header=1.") # <<< REVISED DEBUG LOG
-                # logging.info(f"Successfully re-loaded Excel file {excel_file_path} with header=1.") # Original info
+             logging.error(f"LOAD_EXCEL: Failed to find 'Invoice #' column even after skipping the first row in {excel_file_path}.") # <<< REVISED DEBUG LOG
+             # logging.error(f"Failed to find 'Invoice #' column even after skipping the first row in {excel_file_path}.") # Original error
+             return None
+        else:
+            logging.info(f"LOAD_EXCEL: Successfully re-loaded Excel file {excel_file_path} with header=1.") # <<< REVISED DEBUG LOG
+            # logging.info(f"Successfully re-loaded Excel file {excel_file_path} with header=1.") # Original info
+    else:
+         logging.info(f"LOAD_EXCEL: Initial load of {excel_file_path} with header=0 looks OK (found 'Invoice #').") # <<< REVISED DEBUG LOG
+         # logging.info(f"Initial load of {excel_file_path} looks OK (found 'Invoice #').") # Original info
+
+    date_columns_to_adjust = ['Order Date', 'Turn in Date']
+    current_timestamp = pd.Timestamp.now()
+
+    for col_name in date_columns_to_adjust:
+        if col_name in df.columns:
+            logging.debug("LOAD_EXCEL: Processing Excel column '%s' for date adjustment.", col_name) # <<< REVISED DEBUG LOG (was DEBUG: Processing Excel column)
+            # logging.debug(f"DEBUG: Processing Excel column '{col_name}' for date adjustment.") # Original debug
+            df[col_name] = to_datetime_column(df[col_name])
+            df[col_name] = _adjust_ambiguous_date_years(df[col_name], current_timestamp, series_name=col_name)
         else:
-             logging.info(f"LOAD_EXCEL: Initial load of {excel_file_path} with header=0 looks OK (found 'Invoice #').") # <<< REVISED DEBUG LOG
-             # logging.info(f"Initial load of {excel_file_path} looks OK (found 'Invoice #').") # Original info
+            logging.debug("LOAD_EXCEL: Date column '%s' NOT found in Excel columns for adjustment.", col_name) # <<< REVISED DEBUG LOG (was DEBUG: Excel Column)
+            # logging.debug(f"DEBUG: Excel Column '{col_name}' NOT found in Excel columns. Skipping adjustment for this column.") # Original debug
+    
+    if logging.getLogger().isEnabledFor(logging.DEBUG): # Skip building the DataFrame dump when DEBUG is off
+        logging.debug("LOAD_EXCEL: DataFrame head after loading and date adjustments:\n%s", df.head().to_string()) # <<< NEW DEBUG LOG
+    return df
 
-        date_columns_to_adjust = ['Order Date', 'Turn in Date']
-        current_timestamp = pd.Timestamp.now()
 
-        for col_name in date_columns_to_adjust:
-            if col_name in df.columns:
-                logging.debug(f"LOAD_EXCEL: Processing Excel column '{col_name}' for date adjustment.") # <<< REVISED DEBUG LOG (was DEBUG: Processing Excel column)
-                # logging.debug(f"DEBUG: Processing Excel column '{col_name}' for date adjustment.") # Original debug
-                df[col_name] = pd.to_datetime(df[col_name], errors='coerce')
-                df[col_name] = _adjust_ambiguous_date_years(df[col_name], current_timestamp, series_name=col_name)
-            else:
-                logging.debug(f"LOAD_EXCEL: Date column '{col_name}' NOT found in Excel columns for adjustment.") # <<< REVISED DEBUG LOG (was DEBUG: Excel Column)
-                # logging.debug(f"DEBUG: Excel Column '{col_name}' NOT found in Excel columns. Skipping adjustment for this column.") # Original debug
-        
-        logging.debug(f"LOAD_EXCEL: DataFrame head after loading and date adjustments:\n{df.head().to_string()}") # <<< NEW DEBUG LOG
-        return df
+def show_excel_load_error(excel_file_path: str, error: Exception | None = None) -> None:
+    """
+    Reports a failed read_excel_file call to the user. Must be called from the Tk main thread.
 
-    except FileNotFoundError:
+    Args:
+        excel_file_path (str): The path to the Excel file that failed to load.
+        error (Exception | None): The exception raised by read_excel_file, or None if the
+                                  file was read but the 'Invoice #' column was not found.
+    """
+    if error is None:
+        messagebox.showerror("Excel Load Error", 
+                             f"Could not find the required 'Invoice #' column in the Excel file:\n{excel_file_path}\n\n"
+                             "Please ensure the Excel sheet has a header row containing 'Invoice #' and other expected columns, "
+                             "and that it's located in either the first or second row.")
+    elif isinstance(error, FileNotFoundError):
         logging.error(f"Excel file not found at path: {excel_file_path}")
         messagebox.showerror("Error", f"File not found: {excel_file_path}")
-        return None
-    except Exception as e:
-        logging.error(f"Error reading Excel file {excel_file_path}: {e}", exc_info=True)
-        messagebox.showerror("Error", f"An unexpected error occurred while reading the Excel file: {e}")
-        return None
+    else:
+        logging.error(f"Error reading Excel file {excel_file_path}: {error}", exc_info=error)
+        messagebox.showerror("Error", f"An unexpected error occurred while reading the Excel file: {error}")
+
+
+def apply_status_dtype(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converts the 'Status' column to a pandas Categorical so status filters and counts
+    compare integer codes instead of Python strings. The categories are the configured
+    statuses plus any other value present in the data (so nothing is lost), sorted
+    alphabetically so sorted counts keep their previous order.
+
+    Args:
+        df (pd.DataFrame): The status DataFrame; modified in place.
+
+    Returns:
+        pd.DataFrame: The same DataFrame, for chaining.
+    """
+    if 'Status' not in df.columns:
+        return df
+    known_statuses = set(config.ALLOWED_STATUS) | {config.REVIEW_MISSING_STATUS}
+    categories = sorted(known_statuses | set(df['Status'].dropna().unique()), key=str)
+    df['Status'] = pd.Categorical(df['Status'], categories=categories)
+    return df
 
 
 def load_status() -> pd.DataFrame:
@@ -128,7 +180,7 @@ def load_status() -> pd.DataFrame:
     date_columns = ['Order Date', 'Turn in Date'] # From config or defined logic
 
     try:
-        logging.debug(f"LOAD_STATUS: Trying to load status from SQLite database: {db_path}, table: {table_name}") # <<< REVISED DEBUG LOG
+        logging.debug("LOAD_STATUS: Trying to load status from SQLite database: %s, table: %s", db_path, table_name) # <<< REVISED DEBUG LOG
         # logging.debug(f"Trying to load status from SQLite database: {db_path}, table: {table_name}") # Original debug
         conn = sqlite3.connect(db_path)
         # Check if table exists
@@ -155,7 +207,7 @@ def load_status() -> pd.DataFrame:
         # Convert date columns to datetime objects after loading from SQL
         for col_name in date_columns:
             if col_name in df.columns:
-                df[col_name] = pd.to_datetime(df[col_name], errors='coerce')
+                df[col_name] = to_datetime_column(df[col_name])
             else:
                 logging.warning(f"LOAD_STATUS: Date column '{col_name}' not found in data loaded from SQLite table '{table_name}'.") # <<< REVISED WARNING LOG
                 # logging.warning(f"Date column '{col_name}' not found in data loaded from SQLite table '{table_name}'.") # Original warning
@@ -174,7 +226,7 @@ def load_status() -> pd.DataFrame:
         df = df.reindex(columns=config.EXPECTED_COLUMNS)
         for col_name_date in date_columns:
             if col_name_date in df.columns:
-                 df[col_name_date] = pd.to_datetime(df[col_name_date], errors='coerce')
+                 df[col_name_date] = to_datetime_column(df[col_name_date]) # No-op for columns converted above
         
         # _adjust_ambiguous_date_years might be less relevant if SQLite stores full dates
         # but can be kept if there's a chance partial dates make it into the DB somehow.
@@ -182,7 +234,9 @@ def load_status() -> pd.DataFrame:
         # for col_name in date_columns:
         #     if col_name in df.columns:
         #         df[col_name] = _adjust_ambiguous_date_years(df[col_name], current_timestamp, series_name=f"SQLite_{col_name}")
-        logging.debug(f"LOAD_STATUS: DataFrame head after loading and processing SQLite data:\n{df.head().to_string()}") # <<< NEW DEBUG LOG
+        apply_status_dtype(df)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("LOAD_STATUS: DataFrame head after loading and processing SQLite data:\n%s", df.head().to_string()) # <<< NEW DEBUG LOG
         return df
         
     except sqlite3.Error as e:
@@ -202,60 +256,84 @@ def load_status() -> pd.DataFrame:
     return empty_df
 
 
-def save_status(df: pd.DataFrame) -> None:
+def prepare_status_for_save(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Saves the current status DataFrame to an SQLite database (config.STATUS_FILE).
-    The table (config.DB_TABLE_NAME) is replaced if it exists.
-    Only the config.EXPECTED_COLUMNS are saved.
+    Builds the frame that will be written by write_status_to_db: only the config.EXPECTED_COLUMNS,
+    in order, with date columns as datetimes. The result is a separate frame from df, so it can be
+    handed to a worker thread while the UI keeps editing df.
 
     Args:
-        df (pd.DataFrame): The DataFrame containing the current job statuses to save.
+        df (pd.DataFrame): The DataFrame containing the current job statuses.
+
+    Returns:
+        pd.DataFrame: The snapshot to save.
     """
-    if df is None:
-        logging.warning("SAVE_STATUS: Attempted to save a None DataFrame. Operation skipped.") # <<< REVISED WARNING LOG
-        # logging.warning("Attempted to save a None DataFrame. Operation skipped.") # Original warning
-        messagebox.showwarning("Save Warning", "No data to save.")
-        return
+    date_columns_to_check = ['Order Date', 'Turn in Date']
+    # The in-memory status_df is the canonical store, so it is written directly.
+    # Ensure only expected columns are saved, in the correct order (reindex returns a new frame,
+    # so no separate full copy of the caller's DataFrame is needed).
+    df_to_save = df.reindex(columns=config.EXPECTED_COLUMNS)
+    # Ensure date columns are datetime objects for SQLite compatibility (though SQLite stores them as text/real/integer)
+    # Pandas to_sql handles type conversion appropriately for common types.
+    for col in date_columns_to_check:
+        if col in df_to_save.columns and not pd.api.types.is_datetime64_any_dtype(df_to_save[col]):
+            df_to_save[col] = to_datetime_column(df_to_save[col])
+    return df_to_save
+
+
+def write_status_to_db(df_to_save: pd.DataFrame) -> None:
+    """
+    Writes a frame prepared by prepare_status_for_save to the SQLite database (config.STATUS_FILE),
+    replacing the table (config.DB_TABLE_NAME) if it exists. Performs no UI interaction, so it can
+    run on a worker thread.
+
+    Args:
+        df_to_save (pd.DataFrame): The prepared DataFrame to write.
 
+    Raises:
+        sqlite3.Error: If the database write fails.
+    """
     db_path = config.STATUS_FILE
     table_name = config.DB_TABLE_NAME
-    date_columns_to_check = ['Order Date', 'Turn in Date']
-
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("SAVE_STATUS: DataFrame head before saving to SQLite:\n%s", df_to_save.head().to_string()) # <<< NEW DEBUG LOG
 
+    conn = sqlite3.connect(db_path)
     try:
-        df_to_save = df.copy()
-        # Ensure date columns are datetime objects for SQLite compatibility (though SQLite stores them as text/real/integer)
-        # Pandas to_sql handles type conversion appropriately for common types.
-        for col in date_columns_to_check:
-            if col in df_to_save.columns:
-                df_to_save[col] = pd.to_datetime(df_to_save[col], errors='coerce')
-        
-        # Ensure only expected columns are saved, in the correct order.
-        df_to_save = df_to_save.reindex(columns=config.EXPECTED_COLUMNS)
-        logging.debug(f"SAVE_STATUS: DataFrame head before saving to SQLite:\n{df_to_save.head().to_string()}") # <<< NEW DEBUG LOG
-
-        conn = sqlite3.connect(db_path)
         # Save DataFrame to SQL, replacing table if it exists
         df_to_save.to_sql(table_name, conn, if_exists='replace', index=False)
+    finally:
         conn.close()
-        
-        logging.info(f"SAVE_STATUS: Status data successfully saved to SQLite: {db_path}, table: {table_name}") # <<< REVISED INFO LOG
-        # logging.info(f"Status data successfully saved to SQLite: {db_path}, table: {table_name}") # Original info
+
+    logging.info(f"SAVE_STATUS: Status data successfully saved to SQLite: {db_path}, table: {table_name}") # <<< REVISED INFO LOG
+    # logging.info(f"Status data successfully saved to SQLite: {db_path}, table: {table_name}") # Original info
+
+
+def show_save_status_result(error: Exception | None = None) -> None:
+    """
+    Reports the outcome of write_status_to_db to the user. Must be called from the Tk main thread.
+
+    Args:
+        error (Exception | None): The exception raised while saving, or None if the save succeeded.
+    """
+    db_path = config.STATUS_FILE
+    table_name = config.DB_TABLE_NAME
+    if error is None:
         messagebox.showinfo("Info", "Status saved successfully to database.")
-    except sqlite3.Error as e:
-        logging.error(f"SAVE_STATUS: SQLite error saving status to {db_path}, table {table_name}: {e}", exc_info=True) # <<< REVISED ERROR LOG
+    elif isinstance(error, sqlite3.Error):
+        logging.error(f"SAVE_STATUS: SQLite error saving status to {db_path}, table {table_name}: {error}", exc_info=error) # <<< REVISED ERROR LOG
         # logging.error(f"SQLite error saving status to {db_path}, table {table_name}: {e}", exc_info=True) # Original error
-        messagebox.showerror("Database Error", f"Error saving status to database: {e}")
-    except Exception as e:
-        logging.error(f"SAVE_STATUS: Error saving status to {db_path}: {e}", exc_info=True) # <<< REVISED ERROR LOG
+        messagebox.showerror("Database Error", f"Error saving status to database: {error}")
+    else:
+        logging.error(f"SAVE_STATUS: Error saving status to {db_path}: {error}", exc_info=error) # <<< REVISED ERROR LOG
         # logging.error(f"Error saving status to {db_path}: {e}", exc_info=True) # Original error
-        messagebox.showerror("Error", f"Error saving status: {e}")
+        messagebox.showerror("Error", f"Error saving status: {error}")
 
 
 def process_data(new_df_raw: pd.DataFrame, current_status_df: pd.DataFrame) -> pd.DataFrame | None:
     """
     Merges new Excel data with the current status DataFrame, handling new, 
-    existing, and missing jobs. Assumes new_df_raw has already had its dates adjusted by load_excel.
+    existing, and missing jobs. Assumes new_df_raw has already had its dates adjusted by read_excel_file.
     Uses 'Invoice #' as the key column.
 
     Args:
@@ -267,9 +345,10 @@ def process_data(new_df_raw: pd.DataFrame, current_status_df: pd.DataFrame) -> p
                              error (like missing 'Invoice #' after loading) occurs.
     """
     logging.info("PROCESS_DATA: Starting data processing: merging new Excel data with current status.") # <<< REVISED INFO LOG
-    logging.debug(f"PROCESS_DATA: Initial new_df_raw columns: {new_df_raw.columns.tolist()}") # <<< NEW DEBUG LOG
-    logging.debug(f"PROCESS_DATA: Initial current_status_df columns: {current_status_df.columns.tolist()}") # <<< NEW DEBUG LOG
-    logging.debug(f"PROCESS_DATA: current_status_df head (first 5 rows):\n{current_status_df.head().to_string()}") # <<< NEW DEBUG LOG
+    logging.debug("PROCESS_DATA: Initial new_df_raw columns: %s", new_df_raw.columns.tolist()) # <<< NEW DEBUG LOG
+    logging.debug("PROCESS_DATA: Initial current_status_df columns: %s", current_status_df.columns.tolist()) # <<< NEW DEBUG LOG
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("PROCESS_DATA: current_status_df head (first 5 rows):\n%s", current_status_df.head().to_string()) # <<< NEW DEBUG LOG
     # logging.info("Starting data processing: merging new Excel data with current status.") # Original info
 
     new_df_sanitized = new_df_raw.copy()
@@ -277,9 +356,9 @@ def process_data(new_df_raw: pd.DataFrame, current_status_df: pd.DataFrame) -> p
     if not all(isinstance(col, str) and col == col.strip() for col in new_df_sanitized.columns): # Check if sanitization is needed
         new_df_sanitized.columns = [str(col).strip().replace('\n', '').replace('\r', '') for col in new_df_sanitized.columns]
     if original_new_columns != list(new_df_sanitized.columns): # <<< NEW DEBUG LOG
-        logging.debug(f"PROCESS_DATA: Sanitized new DataFrame columns from: {original_new_columns} to: {list(new_df_sanitized.columns)}") # <<< NEW DEBUG LOG
+        logging.debug("PROCESS_DATA: Sanitized new DataFrame columns from: %s to: %s", original_new_columns, list(new_df_sanitized.columns)) # <<< NEW DEBUG LOG
     else: # <<< NEW DEBUG LOG
-        logging.debug(f"PROCESS_DATA: new_df_sanitized columns (no change after sanitization): {list(new_df_sanitized.columns)}") # <<< NEW DEBUG LOG
+        logging.debug("PROCESS_DATA: new_df_sanitized columns (no change after sanitization): %s", list(new_df_sanitized.columns)) # <<< NEW DEBUG LOG
     # logging.debug(f"Sanitized new DataFrame columns: {list(new_df_sanitized.columns)}") # Original debug
 
     # Using 'Invoice #' as the key column
@@ -318,9 +397,9 @@ def process_data(new_df_raw: pd.DataFrame, current_status_df: pd.DataFrame) -> p
         if col_name in new_df_sanitized.columns: # <<< NEW DEBUG LOG
             if col_name not in ['Status', 'Notes']: # <<< NEW DEBUG LOG
                 cols_from_new.append(col_name) # <<< NEW DEBUG LOG
-                logging.debug(f"PROCESS_DATA: Added '{col_name}' to cols_from_new.") # <<< NEW DEBUG LOG
+                logging.debug("PROCESS_DATA: Added '%s' to cols_from_new.", col_name) # <<< NEW DEBUG LOG
         else: # <<< NEW DEBUG LOG
-            logging.debug(f"PROCESS_DATA: Column '{col_name}' from EXPECTED_COLUMNS not found in new_df_sanitized.columns, not added to cols_from_new.") # <<< NEW DEBUG LOG
+            logging.debug("PROCESS_DATA: Column '%s' from EXPECTED_COLUMNS not found in new_df_sanitized.columns, not added to cols_from_new.", col_name) # <<< NEW DEBUG LOG
     # cols_from_new = [col for col in config.EXPECTED_COLUMNS 
     #                  if col in new_df_sanitized.columns and col not in ['Status', 'Notes']] # Original list comprehension
     
@@ -328,7 +407,7 @@ def process_data(new_df_raw: pd.DataFrame, current_status_df: pd.DataFrame) -> p
     if key_column in new_df_sanitized.columns and key_column not in cols_from_new: # <<< REVISED/NEW DEBUG LOG
     # if key_column not in cols_from_new and key_column in new_df_sanitized.columns : # Original if
         cols_from_new.insert(0, key_column)
-        logging.debug(f"PROCESS_DATA: Ensured '{key_column}' is in cols_from_new.") # <<< NEW DEBUG LOG
+        logging.debug("PROCESS_DATA: Ensured '%s' is in cols_from_new.", key_column) # <<< NEW DEBUG LOG
     elif key_column not in cols_from_new and key_column not in new_df_sanitized.columns: # Should have been caught # <<< NEW DEBUG LOG
         logging.error(f"PROCESS_DATA: '{key_column}' is critically missing from new_df_sanitized for merge key preparation (cols_from_new).") # <<< REVISED ERROR LOG
         # logging.error(f"Process_data: '{key_column}' is critically missing from new_df_sanitized for merge key preparation.") # Original error
@@ -336,7 +415,7 @@ def process_data(new_df_raw: pd.DataFrame, current_status_df: pd.DataFrame) -> p
     
     # Remove duplicates from cols_from_new just in case, though logic should prevent it # <<< NEW DEBUG LOG
     cols_from_new = sorted(list(set(cols_from_new)), key=cols_from_new.index) # <<< NEW DEBUG LOG
-    logging.debug(f"PROCESS_DATA: Final cols_from_new for merge: {cols_from_new}") # <<< NEW DEBUG LOG
+    logging.debug("PROCESS_DATA: Final cols_from_new for merge: %s", cols_from_new) # <<< NEW DEBUG LOG
     
     if not cols_from_new: # <<< NEW DEBUG LOG
         logging.error("PROCESS_DATA: cols_from_new is empty. This likely means no matching columns from Excel for merging (excluding Status/Notes). Check Excel headers and config.EXPECTED_COLUMNS.") # <<< NEW DEBUG LOG
@@ -350,7 +429,7 @@ def process_data(new_df_raw: pd.DataFrame, current_status_df: pd.DataFrame) -> p
     else: # <<< NEW DEBUG LOG
         new_data_for_merge = new_df_sanitized[valid_cols_for_merge] # <<< NEW DEBUG LOG
 
-    logging.debug(f"PROCESS_DATA: Columns in new_data_for_merge (right side of merge): {new_data_for_merge.columns.tolist()}") # <<< NEW DEBUG LOG
+    logging.debug("PROCESS_DATA: Columns in new_data_for_merge (right side of merge): %s", new_data_for_merge.columns.tolist()) # <<< NEW DEBUG LOG
 
 
     merged_df = pd.merge(
@@ -362,22 +441,27 @@ def process_data(new_df_raw: pd.DataFrame, current_status_df: pd.DataFrame) -> p
         suffixes=('_old', '_new'),
         indicator=True
     )
-    logging.debug(f"PROCESS_DATA: Merge completed. Merge indicator counts:\n{merged_df['_merge'].value_counts()}") # <<< REVISED DEBUG LOG
-    logging.debug(f"PROCESS_DATA: merged_df columns: {merged_df.columns.tolist()}") # <<< NEW DEBUG LOG
-    logging.debug(f"PROCESS_DATA: merged_df head (first 5 rows):\n{merged_df.head().to_string()}") # <<< NEW DEBUG LOG
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("PROCESS_DATA: Merge completed. Merge indicator counts:\n%s", merged_df['_merge'].value_counts()) # <<< REVISED DEBUG LOG
+        logging.debug("PROCESS_DATA: merged_df columns: %s", merged_df.columns.tolist()) # <<< NEW DEBUG LOG
+        logging.debug("PROCESS_DATA: merged_df head (first 5 rows):\n%s", merged_df.head().to_string()) # <<< NEW DEBUG LOG
     # logging.debug(f"Merge completed. Merge indicator counts:\n{merged_df['_merge'].value_counts()}") # Original debug
 
     processed_rows = []
     date_cols_config = ['Order Date', 'Turn in Date'] 
 
-    for index, row_series in merged_df.iterrows(): # Renamed 'row' to 'row_series' for clarity
+    merged_columns = merged_df.columns.tolist()
+    # Plain tuples from itertuples, zipped into a dict per row, instead of iterrows building a Series per row;
+    # the dict answers the same .get() and 'in' lookups the branches below use
+    for row_values in merged_df.itertuples(index=False, name=None):
+        row_series = dict(zip(merged_columns, row_values))
         current_row_data = {}
         invoice_num = row_series.get(key_column) # Using 'Invoice #'
         merge_type = row_series.get('_merge') # <<< Get merge type
-        logging.debug(f"PROCESS_DATA: Processing Invoice: {invoice_num}, MergeType: {merge_type}") # <<< NEW DEBUG LOG
+        logging.debug("PROCESS_DATA: Processing Invoice: %s, MergeType: %s", invoice_num, merge_type) # <<< NEW DEBUG LOG
 
         if merge_type == 'right_only': # <<< Use merge_type variable
-            logging.debug(f"  RIGHT_ONLY Branch for Invoice: {invoice_num}") # <<< NEW DEBUG LOG
+            logging.debug("  RIGHT_ONLY Branch for Invoice: %s", invoice_num) # <<< NEW DEBUG LOG
             # logging.debug(f"Processing new job (right_only): {key_column} {invoice_num}") # Original debug
             for col in config.EXPECTED_COLUMNS:
                 if col == key_column:
@@ -390,14 +474,14 @@ def process_data(new_df_raw: pd.DataFrame, current_status_df: pd.DataFrame) -> p
                     # CRITICAL FIX for blank columns in new invoices:
                     value_from_new_df = row_series.get(col + '_new') # <<< Get from the new data side
                     is_not_na = pd.notna(value_from_new_df) # <<< NEW DEBUG LOG
-                    logging.debug(f"    RIGHT_ONLY Col: {col}, Suffix: _new, RawValue: '{value_from_new_df}', IsNotNA: {is_not_na}") # <<< NEW DEBUG LOG
+                    logging.debug("    RIGHT_ONLY Col: %s, Suffix: _new, RawValue: '%s', IsNotNA: %s", col, value_from_new_df, is_not_na) # <<< NEW DEBUG LOG
                     current_row_data[col] = value_from_new_df if is_not_na else \
                                             (pd.NaT if col in date_cols_config else None)
-            logging.debug(f"  RIGHT_ONLY generated current_row_data for {invoice_num}: {current_row_data}") # <<< NEW DEBUG LOG
+            logging.debug("  RIGHT_ONLY generated current_row_data for %s: %s", invoice_num, current_row_data) # <<< NEW DEBUG LOG
 
 
         elif merge_type == 'left_only': # <<< Use merge_type variable
-            logging.debug(f"  LEFT_ONLY Branch for Invoice: {invoice_num}") # <<< NEW DEBUG LOG
+            logging.debug("  LEFT_ONLY Branch for Invoice: %s", invoice_num) # <<< NEW DEBUG LOG
             # logging.debug(f"Processing job missing from new Excel (left_only): {key_column} {invoice_num}") # Original debug
             original_status_val = None
             existing_notes = ""
@@ -407,7 +491,7 @@ def process_data(new_df_raw: pd.DataFrame, current_status_df: pd.DataFrame) -> p
                 else:
                     old_col_name = col + '_old' 
                     val_from_row = row_series.get(old_col_name) if old_col_name in row_series else row_series.get(col) # Use row_series
-                    logging.debug(f"    LEFT_ONLY Col: {col}, Value from row_series: '{val_from_row}'") # <<< NEW DEBUG LOG
+                    logging.debug("    LEFT_ONLY Col: %s, Value from row_series: '%s'", col, val_from_row) # <<< NEW DEBUG LOG
                     current_row_data[col] = val_from_row if pd.notna(val_from_row) else (pd.NaT if col in date_cols_config else None)
 
                     if col == 'Status': original_status_val = current_row_data[col]
@@ -422,23 +506,23 @@ def process_data(new_df_raw: pd.DataFrame, current_status_df: pd.DataFrame) -> p
             current_row_data['Notes'] = (alert_message + "\n-----\n" + existing_notes).strip()
             logging.info(f"  LEFT_ONLY: Invoice {invoice_num} Status set to '{config.REVIEW_MISSING_STATUS}'.") # <<< REVISED INFO LOG (was f"{key_column} {invoice_num}: Status set to...")
             # logging.info(f"{key_column} {invoice_num}: Status set to '{config.REVIEW_MISSING_STATUS}' and Notes updated.") # Original info
-            logging.debug(f"  LEFT_ONLY generated current_row_data for {invoice_num}: {current_row_data}") # <<< NEW DEBUG LOG
+            logging.debug("  LEFT_ONLY generated current_row_data for %s: %s", invoice_num, current_row_data) # <<< NEW DEBUG LOG
 
         elif merge_type == 'both': # <<< Use merge_type variable
-            logging.debug(f"  BOTH Branch for Invoice: {invoice_num}") # <<< NEW DEBUG LOG
+            logging.debug("  BOTH Branch for Invoice: %s", invoice_num) # <<< NEW DEBUG LOG
             # logging.debug(f"Processing existing job (both): {key_column} {invoice_num}") # Original debug
             for col in config.EXPECTED_COLUMNS:
                 if col == key_column:
                     current_row_data[col] = invoice_num
                 elif col in ['Status', 'Notes']: 
                     val_status_notes = row_series.get(col) # Use row_series
-                    logging.debug(f"    BOTH Col(Status/Notes): {col}, Value: '{val_status_notes}' (from current data)") # <<< NEW DEBUG LOG
+                    logging.debug("    BOTH Col(Status/Notes): %s, Value: '%s' (from current data)", col, val_status_notes) # <<< NEW DEBUG LOG
                     current_row_data[col] = val_status_notes if pd.notna(val_status_notes) else ('' if col == 'Notes' else 'New') # Use val_status_notes
                 else: 
                     new_val = row_series.get(col + '_new') # Use row_series
                     old_val = row_series.get(col + '_old') # Use row_series
                     is_new_val_not_na = pd.notna(new_val) # <<< NEW DEBUG LOG
-                    logging.debug(f"    BOTH Col: {col}, NewVal: '{new_val}', OldVal: '{old_val}', IsNewNotNA: {is_new_val_not_na}") # <<< NEW DEBUG LOG
+                    logging.debug("    BOTH Col: %s, NewVal: '%s', OldVal: '%s', IsNewNotNA: %s", col, new_val, old_val, is_new_val_not_na) # <<< NEW DEBUG LOG
                     
                     if col in date_cols_config:
                         current_row_data[col] = new_val if is_new_val_not_na else old_val # Use is_new_val_not_na
@@ -446,7 +530,7 @@ def process_data(new_df_raw: pd.DataFrame, current_status_df: pd.DataFrame) -> p
                         current_row_data[col] = new_val
                     else: 
                         current_row_data[col] = old_val
-            logging.debug(f"  BOTH generated current_row_data for {invoice_num}: {current_row_data}") # <<< NEW DEBUG LOG
+            logging.debug("  BOTH generated current_row_data for %s: %s", invoice_num, current_row_data) # <<< NEW DEBUG LOG
 
 
         # Safeguard check (already present, good)
@@ -473,11 +557,13 @@ def process_data(new_df_raw: pd.DataFrame, current_status_df: pd.DataFrame) -> p
     final_df = final_df.reindex(columns=config.EXPECTED_COLUMNS)
     for col_final_cast in config.EXPECTED_COLUMNS:
         if col_final_cast in date_cols_config:
-            final_df[col_final_cast] = pd.to_datetime(final_df[col_final_cast], errors='coerce')
+            final_df[col_final_cast] = to_datetime_column(final_df[col_final_cast])
         elif col_final_cast == key_column : # Using 'Invoice #'
              final_df[col_final_cast] = final_df[col_final_cast].astype(str)
+    apply_status_dtype(final_df)
     
-    logging.debug(f"PROCESS_DATA: Final DataFrame head before returning (first 5 rows):\n{final_df.head().to_string()}") # <<< NEW DEBUG LOG
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("PROCESS_DATA: Final DataFrame head before returning (first 5 rows):\n%s", final_df.head().to_string()) # <<< NEW DEBUG LOG
     logging.info("PROCESS_DATA: Data processing finished.") # <<< REVISED INFO LOG
     # logging.info("Data processing finished.") # Original info
     return final_df
\ No newline at end of file
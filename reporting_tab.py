@@ -1,20 +1,62 @@
 # reporting_tab.py
 import tkinter as tk
 from tkinter import ttk, messagebox
+import numpy as np
 import pandas as pd
 import logging
 import os # Added for potential path operations, though savefig handles full paths
 
 import config
+import data_utils
 
 # --- Matplotlib Imports ---
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt 
-import matplotlib.colors as mcolors # For more color options
 from matplotlib.ticker import MaxNLocator # For integer ticks on y-axis
+from matplotlib import colormaps
+
+NANOSECONDS_PER_DAY = 86_400 * 1_000_000_000
+
+class _TextChunkBuffer:
+    """
+    Stand-in for a tk.Text that collects insert(tk.END, text, tags) calls, so a whole report
+    can be written to the real widget with a single multi-segment insert (see flush_to).
+    """
+    def __init__(self):
+        self.chunks = [] # Alternating text, tags entries, as Text.insert takes them
+
+    def insert(self, index, text, *tags_and_texts):
+        # Same arguments as Text.insert (text, tags, text, tags, ...); only appends are buffered,
+        # since every report section writes at tk.END
+        self.chunks.append(text)
+        self.chunks.extend(() if item is None else item for item in tags_and_texts)
+        if not len(tags_and_texts) % 2:
+            self.chunks.append(()) # The last text was given without tags
+
+    def flush_to(self, text_widget):
+        """Inserts all buffered segments at the end of text_widget in one Tcl call."""
+        if self.chunks:
+            text_widget.insert(tk.END, *self.chunks)
+        self.chunks = []
 
 class ReportingTab(ttk.Frame):
+    # Colormaps are looked up once; each refresh samples n evenly spaced colors from them
+    # (the same colors get_cmap(name, n) produced, without building a resampled colormap per refresh).
+    _STATUS_COLORMAP = colormaps['Pastel2']
+    _WEEKLY_INTAKE_COLORMAP = colormaps['viridis']
+
+    # Job age buckets (right-closed, in days since turn-in). The edges and the ordered categorical dtype
+    # are built once here, not on every refresh.
+    _AGE_BINS = [-1, 7, 21, 49, 56, np.inf]
+    _AGE_BUCKET_INNER_EDGES = np.array(_AGE_BINS[1:-1], dtype=float)
+    _AGE_BUCKET_DTYPE = pd.CategoricalDtype([
+        'Job Age: 0-7 Days (First Week of Job Age)',
+        'Job Age: 8-21 Days (Job is 2-3 Weeks Old)',
+        'Job Age: 22-49 Days (Job is 4-7 Weeks Old)',
+        'Job Age: 50-56 Days (Job is 8 Weeks Old)',
+        'Job Age: Over 56 Days (Job is Older than 8 Weeks)'
+    ], ordered=True)
+
     def __init__(self, parent_notebook, app_instance):
         super().__init__(parent_notebook)
         self.app = app_instance
@@ -30,6 +72,7 @@ class ReportingTab(ttk.Frame):
         self.overall_financial_summary_chart_figure = None # Store the figure object explicitly
         self.overall_financial_summary_chart_canvas_widget = None 
         self.overall_financial_summary_chart_frame = None 
+        self._last_pie_key = None # (total invoice, total outstanding) the financial chart currently shows
         
         self.overall_charts_canvas = None 
         self.overall_charts_scrollable_frame = None 
@@ -40,6 +83,14 @@ class ReportingTab(ttk.Frame):
         self.weekly_intake_chart_figure = None
         self.weekly_intake_chart_canvas_widget = None
 
+        # (key, open_jobs_df, today) from the last _prepare_open_jobs_data call; cleared by invalidate_prepared_data
+        self._prepared_cache = None
+        self._refresh_pending = False # True while a Refresh click is queued (extra clicks are ignored)
+        self._scrollregion_pending = False # True while a charts scrollregion update is queued
+        # Coordinator tabs whose text is not written yet: pc_name_safe -> (pc_name, pc_open_jobs_df, today, pc_name_safe).
+        # A tab is filled when it is first shown (or exported), not on every refresh.
+        self._dirty_coordinators = {}
+
         self._setup_ui()
 
     def _configure_tags_for_text_widget(self, text_widget):
@@ -58,10 +109,12 @@ class ReportingTab(ttk.Frame):
     def _insert_text_with_tags(self, text_widget, text, tags=None):
         """Helper to insert text with specified tags into a Text widget."""
         processed_text = text
-        if not isinstance(tags, tuple) and tags is not None: 
+        if tags is None:
+            tags = () # No tags (the line break segment below is untagged as well)
+        elif not isinstance(tags, tuple):
             tags = (tags,)
-        text_widget.insert(tk.END, processed_text, tags)
-        text_widget.insert(tk.END, "\n") 
+        # Text and its untagged line break go in as one multi-segment insert (one Tcl call, not two)
+        text_widget.insert(tk.END, processed_text, tags, "\n", ())
 
     # <<< NEW METHOD for inserting separators >>>
     def _insert_separator_line(self, text_widget):
@@ -77,11 +130,12 @@ class ReportingTab(ttk.Frame):
         title_label = ttk.Label(main_report_frame, text="Reporting and Statistics Dashboard", font=self.app.DEFAULT_FONT_BOLD)
         title_label.pack(pady=(0, 10))
 
-        self.refresh_button = ttk.Button(main_report_frame, text="Refresh All Statistics", command=self.display_all_stats)
+        self.refresh_button = ttk.Button(main_report_frame, text="Refresh All Statistics", command=self.request_refresh)
         self.refresh_button.pack(pady=5)
 
         self.stats_notebook = ttk.Notebook(main_report_frame)
         self.stats_notebook.pack(expand=True, fill=tk.BOTH, pady=5)
+        self.stats_notebook.bind("<<NotebookTabChanged>>", lambda e: self._populate_selected_coordinator_tab())
 
         report_bg = getattr(config, 'REPORT_SUB_TAB_BG_COLOR', 'white') 
 
@@ -132,7 +186,7 @@ class ReportingTab(ttk.Frame):
         self.overall_charts_canvas.create_window((0, 0), window=self.overall_charts_scrollable_frame, anchor="nw", tags="scrollable_frame_tag")
 
         # Update scrollregion when the scrollable frame's size changes
-        self.overall_charts_scrollable_frame.bind("<Configure>", lambda e: self.overall_charts_canvas.configure(scrollregion=self.overall_charts_canvas.bbox("all")))
+        self.overall_charts_scrollable_frame.bind("<Configure>", lambda e: self._schedule_scrollregion_update())
 
         # Placeholder frames for charts (actual charts will be drawn here)
         self.overall_status_chart_frame = ttk.Frame(self.overall_charts_scrollable_frame, padding=(5,5))
@@ -153,9 +207,45 @@ class ReportingTab(ttk.Frame):
         ttk.Label(self.weekly_intake_chart_frame, text="Weekly Job Intake Chart (Data will load upon refresh)").pack()
 
 
-    def _create_or_get_coordinator_tab(self, pc_name):
-        """Creates a new tab for a Project Coordinator or returns the existing Text widget if it exists."""
-        pc_name_safe = str(pc_name).replace(".", "_dot_") # Sanitize name for widget path
+    def _schedule_scrollregion_update(self):
+        """Coalesces bursts of <Configure> events (e.g. while resizing) into one scrollregion update when idle."""
+        if not self._scrollregion_pending:
+            self._scrollregion_pending = True
+            self.after_idle(self._apply_scrollregion)
+
+    def _apply_scrollregion(self):
+        self._scrollregion_pending = False
+        self.overall_charts_canvas.configure(scrollregion=self.overall_charts_canvas.bbox("all"))
+
+    def request_refresh(self):
+        """
+        Handler for the 'Refresh All Statistics' button. Runs display_all_stats once the UI is idle;
+        clicks arriving while a refresh is already queued (e.g. a double-click) are ignored.
+        """
+        if self._refresh_pending:
+            logging.info("ReportingTab: Refresh already pending; ignoring extra click.")
+            return
+        self._refresh_pending = True
+        self.after_idle(self._run_pending_refresh)
+
+    def _run_pending_refresh(self):
+        try:
+            self.display_all_stats()
+        finally:
+            # Clicks made while the refresh ran are still queued as events; Tk handles those before idle
+            # callbacks, so clearing the flag from an idle callback lets them be ignored as well.
+            self.after_idle(self._clear_refresh_pending)
+
+    def _clear_refresh_pending(self):
+        self._refresh_pending = False
+
+    def _create_or_get_coordinator_tab(self, pc_name, pc_name_safe=None):
+        """
+        Creates a new tab for a Project Coordinator or returns the existing Text widget if it exists.
+        Callers that already sanitized the name pass it as pc_name_safe.
+        """
+        if pc_name_safe is None:
+            pc_name_safe = str(pc_name).replace(".", "_dot_") # Sanitize name for widget path
         
         # If tab and text area already exist, clear and return it
         if pc_name_safe in self.coordinator_tabs_widgets and self.coordinator_tabs_widgets[pc_name_safe].winfo_exists():
@@ -192,6 +282,29 @@ class ReportingTab(ttk.Frame):
         self.coordinator_tabs_widgets[pc_name_safe] = text_area # Store reference
         return text_area 
 
+    # Character table that drops '$' and ',' from currency strings (used with Series.str.translate)
+    _CURRENCY_STRIP_TABLE = str.maketrans('', '', '$,')
+
+    @staticmethod
+    def _currency_to_numeric(series):
+        """
+        Converts a currency column (e.g. "$1,200.00" or 1200.0) to floats; unparseable values become 0.
+        Args:
+            series (pd.Series): The currency column.
+        Returns:
+            pd.Series: The numeric values.
+        """
+        if pd.api.types.is_numeric_dtype(series):
+            return series.fillna(0)
+        numbers = pd.to_numeric(series, errors='coerce').to_numpy(dtype=float, na_value=np.nan, copy=True)
+        # Only values that are not plain numbers (e.g. "$1,200.00") are turned into strings and stripped,
+        # with one C-level character filter per value instead of two regex passes
+        needs_cleanup = series.notna().to_numpy() & np.isnan(numbers)
+        if needs_cleanup.any():
+            cleaned = series[needs_cleanup].astype(str).str.translate(ReportingTab._CURRENCY_STRIP_TABLE)
+            numbers[needs_cleanup] = pd.to_numeric(cleaned, errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+        return pd.Series(numbers, index=series.index, name=series.name).fillna(0)
+
     def _prepare_open_jobs_data(self):
         """
         Prepares the 'open jobs' DataFrame for reporting.
@@ -206,66 +319,123 @@ class ReportingTab(ttk.Frame):
             logging.warning("ReportingTab: No status_df available for processing.")
             return None, pd.Timestamp.now().normalize()
 
-        df_all_loaded = self.app.status_df.copy()
-        # Ensure date columns are datetime before calculations
-        date_cols_to_convert = ['Turn in Date', 'Order Date'] # Add other relevant date cols if needed
-        for col in date_cols_to_convert:
-            if col in df_all_loaded.columns:
-                df_all_loaded[col] = pd.to_datetime(df_all_loaded[col], errors='coerce')
-
+        # Reuse the last prepared frame while status_df (same object and rows) is unchanged.
+        # In-place edits and deletions are covered by invalidate_prepared_data via notify_data_changed.
+        cache_key = (id(self.app.status_df), len(self.app.status_df),
+                     int(pd.util.hash_pandas_object(self.app.status_df.index, index=False).sum()))
+        today = pd.Timestamp.now().normalize()
+        if self._prepared_cache is not None and self._prepared_cache[0] == cache_key:
+            cached_open_jobs_df, cached_today = self._prepared_cache[1], self._prepared_cache[2]
+            if cached_today == today:
+                logging.info("ReportingTab: status_df unchanged; reusing prepared open jobs data.")
+                return cached_open_jobs_df, cached_today
+            if not cached_open_jobs_df.empty:
+                # A new day only moves the job ages: keep the filtered rows and parsed currency/date columns,
+                # and recompute JobAge_days/Age_Bucket on a shallow copy (the cached frame stays as it was)
+                logging.info("ReportingTab: status_df unchanged since yesterday; recomputing job ages only.")
+                open_jobs_df = cached_open_jobs_df.copy(deep=False)
+                self._add_job_age_columns(open_jobs_df, today)
+                self._prepared_cache = (cache_key, open_jobs_df, today)
+                return open_jobs_df, today
+
+        open_jobs_df, today = self._build_open_jobs_data()
+        self._prepared_cache = (cache_key, open_jobs_df, today)
+        return open_jobs_df, today
 
+    @staticmethod
+    def _status_in(statuses, status_list):
+        """
+        Boolean numpy mask of the rows whose status is one of status_list.
+        Args:
+            statuses (pd.Series): A 'Status' column.
+            status_list (list): The statuses to match.
+        Returns:
+            np.ndarray: True where the row's status is in status_list.
+        """
+        if isinstance(statuses.dtype, pd.CategoricalDtype):
+            # Compare integer category codes instead of hashing every status string
+            categories = statuses.cat.categories
+            matching_codes = [categories.get_loc(status) for status in status_list if status in categories]
+            return np.isin(statuses.cat.codes.to_numpy(), matching_codes)
+        return statuses.isin(status_list).to_numpy()
+
+    def invalidate_prepared_data(self):
+        """Drops the cached open jobs data so the next refresh recomputes it from status_df."""
+        self._prepared_cache = None
+
+    def _build_open_jobs_data(self):
+        """
+        Computes the prepared open jobs DataFrame from app.status_df (see _prepare_open_jobs_data).
+        Returns:
+            pd.DataFrame: The processed open jobs DataFrame.
+            pd.Timestamp: The current timestamp (normalized to day).
+        """
+        df_all_loaded = self.app.status_df
         today = pd.Timestamp.now().normalize() # For consistent age calculation
 
         # Define statuses to exclude for "open jobs"
         excluded_statuses = ['Closed', 'Cancelled/Postponed', config.REVIEW_MISSING_STATUS]
-        open_jobs_df = df_all_loaded[~df_all_loaded['Status'].isin(excluded_statuses)].copy()
+        open_mask = ~self._status_in(df_all_loaded['Status'], excluded_statuses)
+        # Filter first; status_df itself is never copied or modified here. take() already returns a new,
+        # independent frame (no SettingWithCopy tracking), so the open-job slice is not copied a second time.
+        open_jobs_df = df_all_loaded.take(np.flatnonzero(open_mask))
 
         if open_jobs_df.empty:
             logging.info("ReportingTab: No open jobs after filtering.")
             return open_jobs_df, today 
 
+        # Ensure date columns are datetime before calculations
+        date_cols_to_convert = ['Turn in Date', 'Order Date'] # Add other relevant date cols if needed
+        for col in date_cols_to_convert:
+            if col in open_jobs_df.columns:
+                open_jobs_df[col] = data_utils.to_datetime_column(open_jobs_df[col]) # No-op when already datetime64
+
+        if isinstance(open_jobs_df['Status'].dtype, pd.CategoricalDtype):
+            # Drop excluded/absent statuses so value_counts only reports statuses that have open jobs
+            open_jobs_df['Status'] = open_jobs_df['Status'].cat.remove_unused_categories()
+
         # Convert currency columns to numeric, handling errors
         # 'Balance' column is OUTSTANDING balance
         if 'Balance' in open_jobs_df.columns:
-            open_jobs_df['Balance_numeric'] = pd.to_numeric(
-                open_jobs_df['Balance'].astype(str).replace({'\$': '', ',': ''}, regex=True),
-                errors='coerce').fillna(0)
+            open_jobs_df['Balance_numeric'] = self._currency_to_numeric(open_jobs_df['Balance'])
         if 'Invoice Total' in open_jobs_df.columns:
-            open_jobs_df['InvoiceTotal_numeric'] = pd.to_numeric(
-                open_jobs_df['Invoice Total'].astype(str).replace({'\$': '', ',': ''}, regex=True),
-                errors='coerce').fillna(0)
+            open_jobs_df['InvoiceTotal_numeric'] = self._currency_to_numeric(open_jobs_df['Invoice Total'])
 
-        # Calculate Job Age and Age Buckets
         turn_in_date_col = 'Turn in Date'
         if turn_in_date_col in open_jobs_df.columns:
-            open_jobs_df['TurnInDate_dt'] = pd.to_datetime(open_jobs_df[turn_in_date_col], errors='coerce')
-            
-            valid_turn_in_dates_mask = open_jobs_df['TurnInDate_dt'].notna()
-            open_jobs_df['JobAge_days'] = pd.NA # Initialize column
+            open_jobs_df['TurnInDate_dt'] = data_utils.to_datetime_column(open_jobs_df[turn_in_date_col])
+        self._add_job_age_columns(open_jobs_df, today)
+        return open_jobs_df, today
 
-            if valid_turn_in_dates_mask.any():
-                open_jobs_df.loc[valid_turn_in_dates_mask, 'JobAge_days'] = \
-                    (today - open_jobs_df.loc[valid_turn_in_dates_mask, 'TurnInDate_dt']).dt.days
-                open_jobs_df['JobAge_days'] = pd.to_numeric(open_jobs_df['JobAge_days'], errors='coerce') # Ensure numeric
+    @staticmethod
+    def _add_job_age_columns(open_jobs_df, today):
+        """
+        Adds (or replaces) the 'JobAge_days' and 'Age_Bucket' columns of the prepared open jobs DataFrame.
+        Args:
+            open_jobs_df (pd.DataFrame): The open jobs, with 'TurnInDate_dt' when the turn-in date is known.
+            today (pd.Timestamp): The day ages are measured to (normalized).
+        """
+        if 'TurnInDate_dt' in open_jobs_df.columns:
+            # Whole days since turn-in in one float pass over the nanosecond values (same as (today - date).dt.days);
+            # NaT dates become NaN, so no mask/assign step or object-dtype column is needed.
+            turn_in_ns = open_jobs_df['TurnInDate_dt'].to_numpy(dtype='datetime64[ns]').view('i8').astype(float)
+            turn_in_ns[open_jobs_df['TurnInDate_dt'].isna().to_numpy()] = np.nan
+            # Whole-day ages are exact in float32 (NaN still marks a missing date), halving the column's size
+            open_jobs_df['JobAge_days'] = np.floor((today.value - turn_in_ns) / NANOSECONDS_PER_DAY).astype(np.float32)
 
             if open_jobs_df['JobAge_days'].notna().any():
-                age_bins = [-1, 7, 21, 49, 56, float('inf')] 
-                age_labels = [
-                    'Job Age: 0-7 Days (First Week of Job Age)', 
-                    'Job Age: 8-21 Days (Job is 2-3 Weeks Old)', 
-                    'Job Age: 22-49 Days (Job is 4-7 Weeks Old)', 
-                    'Job Age: 50-56 Days (Job is 8 Weeks Old)', 
-                    'Job Age: Over 56 Days (Job is Older than 8 Weeks)'
-                ]
-                open_jobs_df['Age_Bucket'] = pd.cut(open_jobs_df['JobAge_days'], bins=age_bins, labels=age_labels, right=True)
+                # Same right-closed bins as pd.cut, without building an IntervalIndex: searchsorted over the
+                # inner edges gives each age's bucket code; NaN and ages outside (-1, inf] get code -1 (missing).
+                ages = open_jobs_df['JobAge_days'].to_numpy(dtype=float, na_value=np.nan)
+                bucket_codes = np.searchsorted(ReportingTab._AGE_BUCKET_INNER_EDGES, ages, side='left')
+                bucket_codes[np.isnan(ages) | (ages <= ReportingTab._AGE_BINS[0])] = -1
+                open_jobs_df['Age_Bucket'] = pd.Categorical.from_codes(bucket_codes, dtype=ReportingTab._AGE_BUCKET_DTYPE)
             else:
                 open_jobs_df['Age_Bucket'] = pd.NA 
         else:
             logging.warning("ReportingTab: 'Turn in Date' column not found. Cannot calculate job age.")
             open_jobs_df['JobAge_days'] = pd.NA
             open_jobs_df['Age_Bucket'] = pd.NA
-            
-        return open_jobs_df, today
 
     def _prepare_weekly_intake_data(self, source_df):
         """
@@ -284,7 +454,7 @@ class ReportingTab(ttk.Frame):
             return None
 
         df_copy = source_df.copy()
-        df_copy['TurnInDate_dt'] = pd.to_datetime(df_copy['Turn in Date'], errors='coerce')
+        df_copy['TurnInDate_dt'] = data_utils.to_datetime_column(df_copy['Turn in Date'])
         df_copy = df_copy.dropna(subset=['TurnInDate_dt'])
 
         if df_copy.empty:
@@ -311,14 +481,8 @@ class ReportingTab(ttk.Frame):
             parent_frame (tk.Frame): The Tkinter frame to embed the chart in.
             intake_data (pd.Series): Data prepared by _prepare_weekly_intake_data.
         """
-        if hasattr(self, 'weekly_intake_chart_canvas_widget') and self.weekly_intake_chart_canvas_widget:
-            self.weekly_intake_chart_canvas_widget.get_tk_widget().destroy()
-            self.weekly_intake_chart_canvas_widget = None
-            self.weekly_intake_chart_figure = None 
-        for widget in parent_frame.winfo_children(): 
-            widget.destroy()
-
         if intake_data is None or intake_data.empty:
+            self._discard_weekly_intake_chart(parent_frame)
             ttk.Label(parent_frame, text="No data available to display for weekly job intake (last 3 months).").pack(expand=True, fill=tk.BOTH)
             logging.info("ReportingTab: No intake data to plot for weekly chart (last 3 months).")
             return
@@ -328,10 +492,12 @@ class ReportingTab(ttk.Frame):
             fig_width = max(8, num_weeks * 0.5) 
             fig_height = 5 
 
-            self.weekly_intake_chart_figure = Figure(figsize=(fig_width, fig_height), dpi=90)
+            # Same figure/canvas reuse as the status and financial charts
+            self.weekly_intake_chart_figure, self.weekly_intake_chart_canvas_widget = self._prepare_chart_canvas(
+                parent_frame, self.weekly_intake_chart_figure, self.weekly_intake_chart_canvas_widget, (fig_width, fig_height))
             ax = self.weekly_intake_chart_figure.add_subplot(111)
             
-            intake_data.plot(kind='bar', ax=ax, color=plt.cm.get_cmap('viridis', num_weeks)(range(num_weeks)))
+            intake_data.plot(kind='bar', ax=ax, color=self._WEEKLY_INTAKE_COLORMAP(np.linspace(0, 1, num_weeks)))
             
             ax.set_title('Weekly Job Intake (Last 3 Months by Turn in Date)', fontsize=config.DEFAULT_FONT_SIZE + 1)
             ax.set_xlabel('Week of Year (Monday Start)', fontsize=config.DEFAULT_FONT_SIZE)
@@ -346,43 +512,147 @@ class ReportingTab(ttk.Frame):
             
             self.weekly_intake_chart_figure.tight_layout()
 
-            self.weekly_intake_chart_canvas_widget = FigureCanvasTkAgg(self.weekly_intake_chart_figure, master=parent_frame)
-            self.weekly_intake_chart_canvas_widget.draw()
-            canvas_tk_widget = self.weekly_intake_chart_canvas_widget.get_tk_widget()
-            canvas_tk_widget.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+            self.weekly_intake_chart_canvas_widget.draw_idle() # Rendered once Tk is idle instead of synchronously here
             
             logging.info(f"ReportingTab: Successfully created weekly intake chart with {num_weeks} weeks (last 3 months).")
 
         except Exception as e:
             logging.error(f"ReportingTab: Error creating weekly intake chart: {e}", exc_info=True)
+            self._discard_weekly_intake_chart(parent_frame)
             ttk.Label(parent_frame, text=f"Error creating weekly intake chart: {e}").pack(expand=True, fill=tk.BOTH)
-            self.weekly_intake_chart_figure = None
 
 
-    def _create_status_distribution_chart(self, parent_frame, open_jobs_df):
-        """Creates and embeds a horizontal bar chart for status distribution."""
-        if hasattr(self, 'overall_status_chart_canvas_widget') and self.overall_status_chart_canvas_widget:
+    def _prepare_chart_canvas(self, parent_frame, figure, canvas_widget, figsize):
+        """
+        Returns an empty Figure and its FigureCanvasTkAgg embedded in parent_frame, ready to plot into.
+        An existing pair is cleared and resized instead of being destroyed and rebuilt.
+        Args:
+            parent_frame (tk.Frame): The Tkinter frame the chart is embedded in.
+            figure (Figure | None): The chart's current Figure, if any.
+            canvas_widget (FigureCanvasTkAgg | None): The chart's current canvas, if any.
+            figsize (tuple): The (width, height) in inches for this refresh.
+        Returns:
+            tuple: (Figure, FigureCanvasTkAgg)
+        """
+        if figure is not None and canvas_widget is not None and canvas_widget.get_tk_widget().winfo_exists():
+            canvas_tk_widget = canvas_widget.get_tk_widget()
+            for widget in parent_frame.winfo_children():
+                if widget is not canvas_tk_widget: widget.destroy() # e.g. a leftover placeholder label
+            figure.clear()
+            figure.set_size_inches(figsize, forward=False)
+            # Embedded canvases have no window manager to forward the new size to, so resize the widget;
+            # FigureCanvasTkAgg adopts the widget size on its next <Configure>.
+            canvas_tk_widget.configure(width=int(figsize[0] * figure.dpi), height=int(figsize[1] * figure.dpi))
+            return figure, canvas_widget
+
+        for widget in parent_frame.winfo_children(): widget.destroy()
+        figure = Figure(figsize=figsize, dpi=90)
+        canvas_widget = FigureCanvasTkAgg(figure, master=parent_frame)
+        canvas_widget.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        return figure, canvas_widget
+
+    def _discard_status_chart(self, parent_frame):
+        """Destroys the status chart's canvas and figure along with anything else shown in parent_frame."""
+        if self.overall_status_chart_canvas_widget:
             self.overall_status_chart_canvas_widget.get_tk_widget().destroy()
-            self.overall_status_chart_canvas_widget = None
-            self.overall_status_chart_figure = None 
-        for widget in parent_frame.winfo_children(): widget.destroy() 
+        self.overall_status_chart_canvas_widget = None
+        self.overall_status_chart_figure = None
+        for widget in parent_frame.winfo_children(): widget.destroy()
+
+    def _discard_financial_summary_chart(self, parent_frame):
+        """Destroys the financial summary chart's canvas and figure along with anything else shown in parent_frame."""
+        self._last_pie_key = None
+        if self.overall_financial_summary_chart_canvas_widget:
+            self.overall_financial_summary_chart_canvas_widget.get_tk_widget().destroy()
+        self.overall_financial_summary_chart_canvas_widget = None
+        self.overall_financial_summary_chart_figure = None
+        for widget in parent_frame.winfo_children(): widget.destroy()
+
+    def _discard_weekly_intake_chart(self, parent_frame):
+        """Destroys the weekly intake chart's canvas and figure along with anything else shown in parent_frame."""
+        if self.weekly_intake_chart_canvas_widget:
+            self.weekly_intake_chart_canvas_widget.get_tk_widget().destroy()
+        self.weekly_intake_chart_canvas_widget = None
+        self.weekly_intake_chart_figure = None
+        for widget in parent_frame.winfo_children(): widget.destroy()
 
+    @staticmethod
+    def _count_statuses(open_jobs_df):
+        """
+        Counts open jobs per status, ordered by status.
+        Args:
+            open_jobs_df (pd.DataFrame | None): The prepared open jobs DataFrame.
+        Returns:
+            pd.Series | None: Job count per status, or None if there is no status data.
+        """
         if open_jobs_df is None or open_jobs_df.empty or 'Status' not in open_jobs_df.columns:
-            ttk.Label(parent_frame, text="No data for status chart.").pack(expand=True, fill=tk.BOTH)
-            return
-        
-        status_counts = open_jobs_df['Status'].value_counts().sort_index()
-        if status_counts.empty:
-            ttk.Label(parent_frame, text="No status data to plot.").pack(expand=True, fill=tk.BOTH)
+            return None
+        statuses = open_jobs_df['Status']
+        if isinstance(statuses.dtype, pd.CategoricalDtype):
+            # Categorical counts come back in category order (already sorted), so no sort_index pass is needed
+            return statuses.value_counts(sort=False)
+        return statuses.value_counts().sort_index()
+
+    @staticmethod
+    def _count_statuses_by_frequency(statuses):
+        """
+        Counts jobs per status, most frequent first; statuses with equal counts keep the order in which
+        they first appear (as value_counts did before Status became categorical, where ties follow
+        category order instead).
+        Args:
+            statuses (pd.Series): A 'Status' column.
+        Returns:
+            list: (status, job count) pairs for the statuses that occur.
+        """
+        if not isinstance(statuses.dtype, pd.CategoricalDtype):
+            return list(statuses.value_counts().items())
+        codes = statuses.cat.codes.to_numpy()
+        present_codes, first_positions, counts = np.unique(codes[codes >= 0], return_index=True, return_counts=True)
+        order = np.lexsort((first_positions, -counts)) # By count (descending), then by first appearance
+        return list(zip(statuses.cat.categories[present_codes[order]], counts[order].tolist()))
+
+    @staticmethod
+    def _count_age_buckets(age_buckets):
+        """
+        Counts jobs per age bucket, in bucket order and including empty buckets (like value_counts().sort_index()).
+        Args:
+            age_buckets (pd.Series): An 'Age_Bucket' column.
+        Returns:
+            list: (bucket label, job count) pairs.
+        """
+        if isinstance(age_buckets.dtype, pd.CategoricalDtype):
+            # One bincount over the integer bucket codes; code -1 (no age) is left out
+            codes = age_buckets.cat.codes.to_numpy()
+            counts = np.bincount(codes[codes >= 0], minlength=len(age_buckets.cat.categories))
+            return list(zip(age_buckets.cat.categories, counts.tolist()))
+        return list(age_buckets.value_counts().sort_index().items())
+
+    def _create_status_distribution_chart(self, parent_frame, open_jobs_df, status_counts=None):
+        """
+        Creates and embeds a horizontal bar chart for status distribution.
+        status_counts can be passed in when the caller already computed it with _count_statuses.
+        """
+        if status_counts is None:
+            status_counts = self._count_statuses(open_jobs_df)
+
+        if status_counts is None or status_counts.empty:
+            self._discard_status_chart(parent_frame)
+            no_data_text = "No data for status chart." if status_counts is None else "No status data to plot."
+            ttk.Label(parent_frame, text=no_data_text).pack(expand=True, fill=tk.BOTH)
             return
 
         try:
             fig_height = max(3.5, len(status_counts) * 0.5) 
-            self.overall_status_chart_figure = Figure(figsize=(6, fig_height), dpi=90) 
+            self.overall_status_chart_figure, self.overall_status_chart_canvas_widget = self._prepare_chart_canvas(
+                parent_frame, self.overall_status_chart_figure, self.overall_status_chart_canvas_widget, (6, fig_height))
             ax = self.overall_status_chart_figure.add_subplot(111)
             
-            colors = plt.cm.get_cmap('Pastel2', len(status_counts)) 
-            bars = status_counts.plot(kind='barh', ax=ax, color=[colors(i) for i in range(len(status_counts))])
+            bars = status_counts.plot(kind='barh', ax=ax, color=self._STATUS_COLORMAP(np.linspace(0, 1, len(status_counts))))
+            # The data range is known, so fix the limits instead of letting later artists (the value labels) re-trigger autoscaling.
+            # pandas already placed one y tick per status; the extra 10% leaves room for the count labels.
+            ax.set_autoscale_on(False)
+            ax.set_xlim(0, max(1, status_counts.max()) * 1.1)
+            ax.set_ylim(-0.5, len(status_counts) - 0.5)
             
             ax.set_title('Open Jobs by Status', fontsize=config.DEFAULT_FONT_SIZE +1)
             ax.set_xlabel('Number of Open Jobs', fontsize=config.DEFAULT_FONT_SIZE)
@@ -400,39 +670,37 @@ class ReportingTab(ttk.Frame):
             for i, v in enumerate(status_counts):
                 ax.text(v + 0.2, i, str(v), color='black', va='center', fontweight='normal', fontsize=config.DEFAULT_FONT_SIZE -1)
             
-            self.overall_status_chart_canvas_widget = FigureCanvasTkAgg(self.overall_status_chart_figure, master=parent_frame)
-            self.overall_status_chart_canvas_widget.draw()
-            canvas_tk_widget = self.overall_status_chart_canvas_widget.get_tk_widget()
-            canvas_tk_widget.pack(side=tk.TOP, fill=tk.BOTH, expand=True) 
-            parent_frame.update_idletasks() 
+            self.overall_status_chart_canvas_widget.draw_idle() # Rendered once Tk is idle; repeated requests coalesce
             
-            self.overall_charts_canvas.after_idle(lambda: self.overall_charts_canvas.configure(scrollregion=self.overall_charts_canvas.bbox("all")))
+            self._schedule_scrollregion_update()
 
         except Exception as e:
             logging.error(f"ReportingTab: Error creating status distribution chart: {e}", exc_info=True)
+            self._discard_status_chart(parent_frame)
             ttk.Label(parent_frame, text=f"Error creating chart: {e}").pack(expand=True, fill=tk.BOTH)
-            self.overall_status_chart_figure = None 
 
     def _create_financial_summary_chart(self, parent_frame, open_jobs_df):
         """
         Creates and embeds a pie chart for the financial summary.
         Assumes 'Balance_numeric' is OUTSTANDING balance.
         """
-        if hasattr(self, 'overall_financial_summary_chart_canvas_widget') and self.overall_financial_summary_chart_canvas_widget:
-            self.overall_financial_summary_chart_canvas_widget.get_tk_widget().destroy()
-            self.overall_financial_summary_chart_canvas_widget = None
-            self.overall_financial_summary_chart_figure = None 
-        for widget in parent_frame.winfo_children(): widget.destroy()
-
         if open_jobs_df is None or open_jobs_df.empty or \
            'InvoiceTotal_numeric' not in open_jobs_df.columns or \
            'Balance_numeric' not in open_jobs_df.columns: # Balance_numeric is outstanding
+            self._discard_financial_summary_chart(parent_frame)
             ttk.Label(parent_frame, text="No data for financial summary chart.").pack(expand=True, fill=tk.BOTH)
             return
 
         total_invoice = open_jobs_df['InvoiceTotal_numeric'].sum()
         total_outstanding_balance = open_jobs_df['Balance_numeric'].sum() # Sum of 'Balance' column
         total_collected_calculated = total_invoice - total_outstanding_balance
+
+        # The pie only depends on these two totals: if they match the chart on screen, keep it as drawn
+        pie_key = (round(float(total_invoice), 2), round(float(total_outstanding_balance), 2))
+        if pie_key == self._last_pie_key and self.overall_financial_summary_chart_canvas_widget is not None \
+                and self.overall_financial_summary_chart_canvas_widget.get_tk_widget().winfo_exists():
+            logging.info("ReportingTab: Financial totals unchanged; keeping the current financial summary chart.")
+            return
         
         pie_labels_for_legend = []
         pie_values = []
@@ -451,11 +719,13 @@ class ReportingTab(ttk.Frame):
             explode_values.append(0.03)
 
         if not pie_values or sum(pie_values) == 0:
+             self._discard_financial_summary_chart(parent_frame)
              ttk.Label(parent_frame, text="Financial values are zero or not suitable for pie chart.").pack(expand=True, fill=tk.BOTH)
              return
 
         try:
-            self.overall_financial_summary_chart_figure = Figure(figsize=(6, 4.5), dpi=90) 
+            self.overall_financial_summary_chart_figure, self.overall_financial_summary_chart_canvas_widget = self._prepare_chart_canvas(
+                parent_frame, self.overall_financial_summary_chart_figure, self.overall_financial_summary_chart_canvas_widget, (6, 4.5))
             ax = self.overall_financial_summary_chart_figure.add_subplot(111) 
             
             wedges, texts, autotexts = ax.pie(
@@ -482,18 +752,15 @@ class ReportingTab(ttk.Frame):
 
             self.overall_financial_summary_chart_figure.subplots_adjust(left=0.05, bottom=0.05, right=0.70, top=0.88) 
 
-            self.overall_financial_summary_chart_canvas_widget = FigureCanvasTkAgg(self.overall_financial_summary_chart_figure, master=parent_frame)
-            self.overall_financial_summary_chart_canvas_widget.draw()
-            canvas_tk_widget = self.overall_financial_summary_chart_canvas_widget.get_tk_widget()
-            canvas_tk_widget.pack(side=tk.TOP, fill=tk.BOTH, expand=True) 
-            parent_frame.update_idletasks() 
+            self.overall_financial_summary_chart_canvas_widget.draw_idle() # Rendered once Tk is idle; repeated requests coalesce
+            self._last_pie_key = pie_key
             
-            self.overall_charts_canvas.after_idle(lambda: self.overall_charts_canvas.configure(scrollregion=self.overall_charts_canvas.bbox("all")))
+            self._schedule_scrollregion_update()
 
         except Exception as e:
             logging.error(f"ReportingTab: Error creating financial summary pie chart: {e}", exc_info=True)
+            self._discard_financial_summary_chart(parent_frame)
             ttk.Label(parent_frame, text=f"Error creating financial chart: {e}").pack(expand=True, fill=tk.BOTH)
-            self.overall_financial_summary_chart_figure = None 
 
     def display_all_stats(self):
         """Main function to refresh and display all statistics and charts."""
@@ -507,21 +774,16 @@ class ReportingTab(ttk.Frame):
             self._insert_text_with_tags(self.overall_stats_text_area, "No data available in the application.", ("warning_text",))
             self.overall_stats_text_area.config(state=tk.DISABLED)
             # Clear charts as well
-            if hasattr(self, 'overall_status_chart_canvas_widget') and self.overall_status_chart_canvas_widget:
-                self.overall_status_chart_canvas_widget.get_tk_widget().destroy()
-            for widget in self.overall_status_chart_frame.winfo_children(): widget.destroy()
+            self._discard_status_chart(self.overall_status_chart_frame)
             ttk.Label(self.overall_status_chart_frame, text="No data for status chart.").pack(expand=True, fill=tk.BOTH)
             
-            if hasattr(self, 'overall_financial_summary_chart_canvas_widget') and self.overall_financial_summary_chart_canvas_widget:
-                self.overall_financial_summary_chart_canvas_widget.get_tk_widget().destroy()
-            for widget in self.overall_financial_summary_chart_frame.winfo_children(): widget.destroy()
+            self._discard_financial_summary_chart(self.overall_financial_summary_chart_frame)
             ttk.Label(self.overall_financial_summary_chart_frame, text="No data for financial summary chart.").pack(expand=True, fill=tk.BOTH)
             
-            if hasattr(self, 'weekly_intake_chart_canvas_widget') and self.weekly_intake_chart_canvas_widget:
-                self.weekly_intake_chart_canvas_widget.get_tk_widget().destroy()
-            for widget in self.weekly_intake_chart_frame.winfo_children(): widget.destroy()
+            self._discard_weekly_intake_chart(self.weekly_intake_chart_frame)
             ttk.Label(self.weekly_intake_chart_frame, text="No data for weekly intake chart.").pack(expand=True, fill=tk.BOTH)
 
+            self._dirty_coordinators = {}
             for pc_name_safe in list(self.coordinator_tabs_widgets.keys()):
                 try:
                     tab_frame_to_forget = self.coordinator_tabs_widgets[pc_name_safe].master.master 
@@ -535,7 +797,8 @@ class ReportingTab(ttk.Frame):
 
         num_total_jobs_loaded = len(self.app.status_df) if self.app.status_df is not None else 0
         self._populate_overall_pipeline_tab(open_jobs_df, today, num_total_jobs_loaded)
-        self._create_status_distribution_chart(self.overall_status_chart_frame, open_jobs_df)
+        status_counts = self._count_statuses(open_jobs_df) # Counted once per refresh and handed to the chart
+        self._create_status_distribution_chart(self.overall_status_chart_frame, open_jobs_df, status_counts)
         self._create_financial_summary_chart(self.overall_financial_summary_chart_frame, open_jobs_df) 
 
         weekly_intake_data = self._prepare_weekly_intake_data(source_df_for_intake)
@@ -543,15 +806,20 @@ class ReportingTab(ttk.Frame):
 
         project_coordinator_col = 'Project Coordinator'
         active_coordinators_safe = set() 
+        self._dirty_coordinators = {}
 
         if project_coordinator_col in open_jobs_df.columns and not open_jobs_df.empty:
-            unique_coordinators = sorted([pc for pc in open_jobs_df[project_coordinator_col].unique() if pd.notna(pc)])
-            
-            for pc_name in unique_coordinators:
+            # One groupby pass splits the open jobs per coordinator (sorted by name, missing names dropped)
+            # instead of an equality scan plus copy per coordinator; _populate_coordinator_tab only reads its group.
+            for pc_name, pc_specific_df in open_jobs_df.groupby(project_coordinator_col, sort=True, observed=True):
                 pc_name_safe = str(pc_name).replace(".", "_dot_")
                 active_coordinators_safe.add(pc_name_safe)
-                pc_specific_df = open_jobs_df[open_jobs_df[project_coordinator_col] == pc_name].copy()
-                self._populate_coordinator_tab(pc_name, pc_specific_df, today) 
+                # Create (or clear) the tab now so it is listed, but only write its report once it is viewed;
+                # until then it shows a read-only placeholder (_populate_coordinator_tab clears it)
+                pc_text_area = self._create_or_get_coordinator_tab(pc_name_safe, pc_name_safe=pc_name_safe)
+                pc_text_area.insert(tk.END, "Loading…")
+                pc_text_area.config(state=tk.DISABLED)
+                self._dirty_coordinators[pc_name_safe] = (pc_name, pc_specific_df, today, pc_name_safe)
         
         coordinators_to_remove = set(self.coordinator_tabs_widgets.keys()) - active_coordinators_safe
         for pc_name_safe in coordinators_to_remove:
@@ -565,20 +833,79 @@ class ReportingTab(ttk.Frame):
                 except Exception as e: logging.warning(f"ReportingTab: Error removing old tab for {pc_name_safe}: {e}")
                 del self.coordinator_tabs_widgets[pc_name_safe]
         
+        self._populate_selected_coordinator_tab() # A coordinator tab that is already on screen is filled right away
         logging.info("ReportingTab: Statistics refresh complete.")
 
+    def _populate_selected_coordinator_tab(self):
+        """Writes the report of the currently selected coordinator tab if it is still pending."""
+        try:
+            selected_tab_frame = self.stats_notebook.nametowidget(self.stats_notebook.select())
+        except (KeyError, tk.TclError):
+            return # No tab selected yet
+        for pc_name_safe, text_area in self.coordinator_tabs_widgets.items():
+            if text_area.master.master == selected_tab_frame:
+                self._populate_dirty_coordinator(pc_name_safe)
+                break
+
+    def _populate_dirty_coordinator(self, pc_name_safe):
+        """Writes a coordinator's report from the last refresh if it has not been written yet."""
+        pending_report = self._dirty_coordinators.pop(pc_name_safe, None)
+        if pending_report is not None:
+            self._populate_coordinator_tab(*pending_report)
+
+
+    @staticmethod
+    def _column_values(df, column, default, positions=None):
+        """
+        Returns a column of df as a plain array for row loops, or default for every row if the column is missing.
+        Args:
+            df (pd.DataFrame): The DataFrame being reported on.
+            column (str): The column name.
+            default: The value used for each row when the column does not exist.
+            positions (np.ndarray, optional): Integer row positions to take, instead of all rows.
+        Returns:
+            np.ndarray | list: One value per selected row of df.
+        """
+        num_rows = len(df) if positions is None else len(positions)
+        if column not in df.columns:
+            return [default] * num_rows
+        values = df[column].to_numpy()
+        return values if positions is None else values[positions]
 
     def _populate_overall_pipeline_tab(self, open_jobs_df, today, num_total_jobs_loaded):
         """
         Populates the text area of the 'Overall Pipeline Health' tab.
         Assumes 'Balance_numeric' in open_jobs_df is OUTSTANDING balance.
         """
-        txt = self.overall_stats_text_area
-        txt.config(state=tk.NORMAL)
-        txt.delete('1.0', tk.END)
+        text_widget = self.overall_stats_text_area
+        text_widget.config(state=tk.NORMAL)
+        text_widget.delete('1.0', tk.END)
+        # Sections below write into a buffer; the whole report goes to the Text widget in one insert at the end
+        txt = _TextChunkBuffer()
+        format_currency = self.app.CURRENCY_FORMAT.format # Bound once for every amount in the report
         
         num_open_jobs = len(open_jobs_df) if open_jobs_df is not None else 0
 
+        # Numeric columns shared by several sections are pulled out as float arrays once (None if missing).
+        # Together with has_open_jobs/has_status they are the sections' availability checks, so no section
+        # repeats the None/empty/column-membership chain.
+        has_open_jobs = open_jobs_df is not None and not open_jobs_df.empty
+        has_status = has_open_jobs and 'Status' in open_jobs_df.columns
+        job_age_values = balance_values = invoice_total_values = None
+        if has_open_jobs:
+            if 'JobAge_days' in open_jobs_df.columns:
+                job_age_values = open_jobs_df['JobAge_days'].to_numpy(dtype=float, na_value=np.nan)
+            if 'Balance_numeric' in open_jobs_df.columns:
+                balance_values = open_jobs_df['Balance_numeric'].to_numpy(dtype=float, na_value=np.nan) # Outstanding balance
+            if 'InvoiceTotal_numeric' in open_jobs_df.columns:
+                invoice_total_values = open_jobs_df['InvoiceTotal_numeric'].to_numpy(dtype=float, na_value=np.nan)
+        # Age bucket codes and whether any job has a bucket are likewise worked out once here, not per section
+        age_bucket_codes = None
+        if open_jobs_df is not None and 'Age_Bucket' in open_jobs_df.columns and \
+           isinstance(open_jobs_df['Age_Bucket'].dtype, pd.CategoricalDtype): # pd.NA (not categorical) when no job has an age
+            age_bucket_codes = open_jobs_df['Age_Bucket'].cat.codes.to_numpy()
+        has_age_buckets = age_bucket_codes is not None and bool((age_bucket_codes >= 0).any())
+
         self._insert_text_with_tags(txt, f"Overall Snapshot ({today.strftime('%Y-%m-%d %H:%M:%S')})", ("header",))
         self._insert_separator_line(txt) 
         #txt.insert(tk.END, "Total Jobs in Current Dataset: ", ("key_value_label",))
@@ -645,78 +972,93 @@ class ReportingTab(ttk.Frame):
 
         self._insert_text_with_tags(txt, "\"Stuck\" Jobs in Early Stages (Open Jobs > 3 Weeks in early status):", ("subheader",))
         self._insert_separator_line(txt) 
-        if open_jobs_df is not None and not open_jobs_df.empty and 'JobAge_days' in open_jobs_df.columns and 'Status' in open_jobs_df.columns:
+        if has_status and job_age_values is not None:
             early_statuses = ["New", "Waiting Measure", "Ready to order"] 
             stuck_threshold_days = 21 
-            stuck_jobs_df = open_jobs_df[(open_jobs_df['Status'].isin(early_statuses)) & (open_jobs_df['JobAge_days'] > stuck_threshold_days)]
-            if not stuck_jobs_df.empty:
-                self._insert_text_with_tags(txt, f"Found {len(stuck_jobs_df)} potentially stuck job(s):", ("indented_item", "warning_text"))
-                for _, job in stuck_jobs_df.iterrows():
-                    account_name_stuck = job.get('Account', 'N/A')
-                    po_number_stuck = job.get('Invoice #', 'N/A') 
-                    status_stuck = job.get('Status', 'N/A')
-                    age_stuck = job.get('JobAge_days', 0)
-                    pc_stuck = job.get('Project Coordinator', 'N/A')
+            # One numpy mask (NaN ages compare False); the matching row positions index the column arrays
+            # directly, so no filtered DataFrame is built just to be iterated
+            stuck_positions = np.flatnonzero(self._status_in(open_jobs_df['Status'], early_statuses) &
+                                             (job_age_values > stuck_threshold_days))
+            if stuck_positions.size:
+                self._insert_text_with_tags(txt, f"Found {stuck_positions.size} potentially stuck job(s):", ("indented_item", "warning_text"))
+                insert, end = txt.insert, tk.END # Locals for the per-job loop
+                # Plain column arrays zipped together instead of iterrows, which builds a Series per job
+                for account_name_stuck, po_number_stuck, status_stuck, age_stuck, pc_stuck in zip(
+                        self._column_values(open_jobs_df, 'Account', 'N/A', stuck_positions),
+                        self._column_values(open_jobs_df, 'Invoice #', 'N/A', stuck_positions),
+                        self._column_values(open_jobs_df, 'Status', 'N/A', stuck_positions),
+                        job_age_values[stuck_positions],
+                        self._column_values(open_jobs_df, 'Project Coordinator', 'N/A', stuck_positions)):
                     line_stuck = (f"  - Account: {account_name_stuck} - PO #: {po_number_stuck}, "
                                   f"Status: {status_stuck}, Age: {age_stuck:.0f}d, PC: {pc_stuck}")
-                    self._insert_text_with_tags(txt, line_stuck, ("indented_item",))
+                    insert(end, line_stuck, ("indented_item",), "\n", ()) # What _insert_text_with_tags writes, in one call
             else: self._insert_text_with_tags(txt, "No open jobs identified as \"stuck\" in early stages.", ("indented_item",))
         else: self._insert_text_with_tags(txt, "Cannot determine stuck jobs (missing required data like JobAge_days or Status).", ("indented_item", "warning_text"))
         self._insert_text_with_tags(txt, "")
 
         self._insert_text_with_tags(txt, "High-Value Aging Jobs (Open Jobs > 8 Weeks & Outstanding Balance > $10,000):", ("subheader",))
         self._insert_separator_line(txt) 
-        if open_jobs_df is not None and not open_jobs_df.empty and \
-           'JobAge_days' in open_jobs_df.columns and \
-           'Balance_numeric' in open_jobs_df.columns and \
-           'InvoiceTotal_numeric' in open_jobs_df.columns: 
+        if job_age_values is not None and balance_values is not None and invoice_total_values is not None:
             aging_threshold_days = 56 
             value_threshold = 10000 
             # 'Balance_numeric' is outstanding balance
-            hv_aging_df = open_jobs_df[
-                (open_jobs_df['JobAge_days'] > aging_threshold_days) & 
-                (open_jobs_df['Balance_numeric'] > value_threshold)
-            ]
-            if not hv_aging_df.empty:
-                self._insert_text_with_tags(txt, f"Found {len(hv_aging_df)} high-value aging job(s) (outstanding balance > ${value_threshold:,.0f}):", ("indented_item", "warning_text"))
-                for _, job in hv_aging_df.iterrows():
-                    account_name = job.get('Account', 'N/A')
-                    po_number = job.get('Invoice #', 'N/A') 
-                    outstanding_balance_val = job.get('Balance_numeric', 0) # Directly from 'Balance' column
-                    job_total_val = job.get('InvoiceTotal_numeric', 0) 
-                    job_age_days = job.get('JobAge_days', 0)
-                    project_coordinator = job.get('Project Coordinator', 'N/A')
-
-                    outstanding_balance_str = self.app.CURRENCY_FORMAT.format(outstanding_balance_val)
-                    job_total_str = self.app.CURRENCY_FORMAT.format(job_total_val) 
+            # Same pattern as the stuck-jobs list: one mask over the shared arrays (NaN compares False), row positions only
+            hv_aging_positions = np.flatnonzero(
+                (job_age_values > aging_threshold_days) & (balance_values > value_threshold))
+            if hv_aging_positions.size:
+                self._insert_text_with_tags(txt, f"Found {hv_aging_positions.size} high-value aging job(s) (outstanding balance > ${value_threshold:,.0f}):", ("indented_item", "warning_text"))
+                outstanding_balance_strs = [format_currency(value) for value in balance_values[hv_aging_positions]] # Directly from 'Balance' column
+                job_total_strs = [format_currency(value) for value in invoice_total_values[hv_aging_positions]]
+                insert, end = txt.insert, tk.END
+                for account_name, po_number, outstanding_balance_str, job_total_str, job_age_days, project_coordinator in zip(
+                        self._column_values(open_jobs_df, 'Account', 'N/A', hv_aging_positions),
+                        self._column_values(open_jobs_df, 'Invoice #', 'N/A', hv_aging_positions),
+                        outstanding_balance_strs,
+                        job_total_strs,
+                        job_age_values[hv_aging_positions],
+                        self._column_values(open_jobs_df, 'Project Coordinator', 'N/A', hv_aging_positions)):
                     line = (f"  - {account_name} - PO #: {po_number}, " 
                             f"Outstanding Balance: {outstanding_balance_str} (Job Total: {job_total_str}), "
                             f"Age: {job_age_days:.0f}d, PC: {project_coordinator}")
-                    self._insert_text_with_tags(txt, line, ("indented_item",))
+                    insert(end, line, ("indented_item",), "\n", ())
             else: self._insert_text_with_tags(txt, "No high-value aging jobs identified with outstanding balance > $10,000.", ("indented_item",))
         else: self._insert_text_with_tags(txt, "Cannot determine high-value aging jobs (missing required data like JobAge_days, Balance_numeric, or InvoiceTotal_numeric).", ("indented_item", "warning_text"))
         self._insert_text_with_tags(txt, "")
 
         self._insert_text_with_tags(txt, "Total Financial Value by Age Bucket (Open Jobs):", ("subheader",))
         self._insert_separator_line(txt) 
-        if open_jobs_df is not None and not open_jobs_df.empty and 'Age_Bucket' in open_jobs_df.columns and \
-           'InvoiceTotal_numeric' in open_jobs_df.columns and 'Balance_numeric' in open_jobs_df.columns and \
-           open_jobs_df['Age_Bucket'].notna().any() : 
-            financial_by_bucket = open_jobs_df.groupby('Age_Bucket', observed=False).agg( 
-                Total_Invoice_Value=('InvoiceTotal_numeric', 'sum'),
-                Total_Outstanding_Balance=('Balance_numeric', 'sum'), # Sum of 'Balance' (outstanding)
-                Job_Count=('Invoice #', 'count') 
-            )
-            if not financial_by_bucket.empty:
-                for bucket, data in financial_by_bucket.iterrows():
-                    calculated_collected = data['Total_Invoice_Value'] - data['Total_Outstanding_Balance']
-                    txt.insert(tk.END, f"- {bucket} ({data['Job_Count']:.0f} jobs):\n", ("indented_item", "key_value_label"))
-                    txt.insert(tk.END, f"  - Total Invoice Value: ", ("indented_item",))
-                    self._insert_text_with_tags(txt, f"{self.app.CURRENCY_FORMAT.format(data['Total_Invoice_Value'])}", ("indented_item", "bold_metric"))
-                    txt.insert(tk.END, f"  - Total Collected: ", ("indented_item",))
-                    self._insert_text_with_tags(txt, f"{self.app.CURRENCY_FORMAT.format(calculated_collected)}", ("indented_item", "bold_metric"))
-                    txt.insert(tk.END, f"  - Total Remaining Balance: ", ("indented_item",))
-                    self._insert_text_with_tags(txt, f"{self.app.CURRENCY_FORMAT.format(data['Total_Outstanding_Balance'])}", ("indented_item", "bold_metric"))
+        if has_age_buckets and invoice_total_values is not None and balance_values is not None:
+            # Age_Bucket is categorical: sum per bucket with bincount over its integer codes rather than a
+            # categorical groupby. Buckets without any open job are left out of the listing.
+            bucket_labels = open_jobs_df['Age_Bucket'].cat.categories
+            has_bucket = age_bucket_codes >= 0
+            bucket_codes = age_bucket_codes[has_bucket]
+            occupied_buckets = np.flatnonzero(np.bincount(bucket_codes, minlength=len(bucket_labels)))
+            total_invoice_by_bucket = np.bincount(bucket_codes, weights=invoice_total_values[has_bucket],
+                                                  minlength=len(bucket_labels))
+            total_outstanding_by_bucket = np.bincount(bucket_codes, weights=balance_values[has_bucket], # Sum of 'Balance' (outstanding)
+                                                      minlength=len(bucket_labels))
+            job_count_by_bucket = np.bincount(bucket_codes, weights=open_jobs_df['Invoice #'].notna().to_numpy()[has_bucket], # Like groupby 'count'
+                                              minlength=len(bucket_labels))
+            if occupied_buckets.size:
+                total_invoice_by_bucket = total_invoice_by_bucket[occupied_buckets]
+                total_outstanding_by_bucket = total_outstanding_by_bucket[occupied_buckets]
+                # Format every amount column up front; the loop below only inserts
+                total_invoice_strs = [format_currency(value) for value in total_invoice_by_bucket]
+                total_collected_strs = [format_currency(value) for value in total_invoice_by_bucket - total_outstanding_by_bucket]
+                total_outstanding_strs = [format_currency(value) for value in total_outstanding_by_bucket]
+                for bucket, total_invoice_str, total_collected_str, total_outstanding_str, job_count in zip(
+                        bucket_labels[occupied_buckets], total_invoice_strs, total_collected_strs, total_outstanding_strs,
+                        job_count_by_bucket[occupied_buckets]):
+                    # One multi-segment insert per bucket instead of a call (and wrapper frame) per fragment
+                    txt.insert(tk.END,
+                               f"- {bucket} ({job_count:.0f} jobs):\n", ("indented_item", "key_value_label"),
+                               "  - Total Invoice Value: ", ("indented_item",),
+                               total_invoice_str, ("indented_item", "bold_metric"), "\n", (),
+                               "  - Total Collected: ", ("indented_item",),
+                               total_collected_str, ("indented_item", "bold_metric"), "\n", (),
+                               "  - Total Remaining Balance: ", ("indented_item",),
+                               total_outstanding_str, ("indented_item", "bold_metric"), "\n", ())
             else: self._insert_text_with_tags(txt, "No data to aggregate financial value by age bucket.", ("indented_item",))
         else: self._insert_text_with_tags(txt, "Cannot determine financial value by age bucket (missing required data like Age_Bucket or financial columns).", ("indented_item", "warning_text"))
         self._insert_text_with_tags(txt, "")
@@ -725,10 +1067,7 @@ class ReportingTab(ttk.Frame):
         self._insert_text_with_tags(txt, "Jobs with Low Collection (Calculated Collected < 35% of Total):", ("subheader",))
         self._insert_separator_line(txt)
 
-        if open_jobs_df is not None and not open_jobs_df.empty and \
-           'Balance_numeric' in open_jobs_df.columns and \
-           'InvoiceTotal_numeric' in open_jobs_df.columns and \
-           'Status' in open_jobs_df.columns:
+        if has_status and balance_values is not None and invoice_total_values is not None:
 
             statuses_to_exclude_for_low_collection = ['New', 'Waiting Measure']
             df_for_low_collection_check = open_jobs_df[
@@ -753,27 +1092,27 @@ class ReportingTab(ttk.Frame):
 
                 if not low_collection_jobs_df.empty:
                     self._insert_text_with_tags(txt, f"Found {len(low_collection_jobs_df)} job(s) with calculated collection below 35% in relevant statuses:", ("indented_item", "warning_text"))
-                    for _, job_row in low_collection_jobs_df.iterrows():
-                        inv_num = job_row.get('Invoice #', 'N/A')
-                        acc_name = job_row.get('Account', 'N/A')
-                        job_status = job_row.get('Status', 'N/A')
-                        inv_total_val = job_row.get('InvoiceTotal_numeric', 0)
-                        outstanding_bal_val = job_row.get('Balance_numeric', 0) # From 'Balance' column
-                        collected_calc_val = job_row.get('Collected_Amount_Calculated', 0)
-                        coll_perc = job_row.get('Collected_Percentage_Actual', 0)
-                        pc = job_row.get('Project Coordinator', 'N/A')
-
-                        inv_total_str = self.app.CURRENCY_FORMAT.format(inv_total_val)
-                        outstanding_str = self.app.CURRENCY_FORMAT.format(outstanding_bal_val)
-                        collected_calc_str = self.app.CURRENCY_FORMAT.format(collected_calc_val)
+                    insert, end = txt.insert, tk.END
+                    # Which columns exist is decided once per list (see _column_values), not with a .get per job and field
+                    for acc_name, job_status, inv_total_val, outstanding_bal_val, collected_calc_val, coll_perc, pc in zip(
+                            self._column_values(low_collection_jobs_df, 'Account', 'N/A'),
+                            self._column_values(low_collection_jobs_df, 'Status', 'N/A'),
+                            self._column_values(low_collection_jobs_df, 'InvoiceTotal_numeric', 0),
+                            self._column_values(low_collection_jobs_df, 'Balance_numeric', 0), # From 'Balance' column
+                            self._column_values(low_collection_jobs_df, 'Collected_Amount_Calculated', 0),
+                            self._column_values(low_collection_jobs_df, 'Collected_Percentage_Actual', 0),
+                            self._column_values(low_collection_jobs_df, 'Project Coordinator', 'N/A')):
+                        inv_total_str = format_currency(inv_total_val)
+                        outstanding_str = format_currency(outstanding_bal_val)
+                        collected_calc_str = format_currency(collected_calc_val)
                         
                         job_info_line1 = f"{acc_name}: {job_status}"
                         job_info_line2 = (f"    Total: {inv_total_str}, Balance: {outstanding_str}, "
                                           f"Collected: {collected_calc_str} ({coll_perc:.1f}% of total)")
                         #job_info_line3 = f"    PC: {pc}"
                         
-                        self._insert_text_with_tags(txt, job_info_line1, ("indented_item",))
-                        txt.insert(tk.END, job_info_line2 + "\n\n", ("indented_item",))
+                        insert(end, job_info_line1, ("indented_item",), "\n", (),
+                               job_info_line2 + "\n\n", ("indented_item",))
                         #txt.insert(tk.END, job_info_line3 + "\n\n", ("indented_item",))
                 else:
                     self._insert_text_with_tags(txt, "No jobs found with calculated collection below 35% in the specified relevant statuses.", ("indented_item",))
@@ -784,16 +1123,23 @@ class ReportingTab(ttk.Frame):
         self._insert_text_with_tags(txt, "")
         # --- END: New section ---
 
-        txt.config(state=tk.DISABLED) 
+        txt.flush_to(text_widget)
+        text_widget.see("1.0")
+        text_widget.config(state=tk.DISABLED) 
 
 
-    def _populate_coordinator_tab(self, pc_name_display, pc_open_jobs_df, today):
+    def _populate_coordinator_tab(self, pc_name_display, pc_open_jobs_df, today, pc_name_safe=None):
         """
         Populates the text area of a specific Project Coordinator's tab.
         Assumes 'Balance_numeric' in pc_open_jobs_df is OUTSTANDING balance.
+        pc_name_safe is the already-sanitized tab key, when the caller has it.
         """
-        pc_name_safe = str(pc_name_display).replace(".", "_dot_") 
-        txt = self._create_or_get_coordinator_tab(pc_name_safe) 
+        if pc_name_safe is None:
+            pc_name_safe = str(pc_name_display).replace(".", "_dot_") 
+        text_widget = self._create_or_get_coordinator_tab(pc_name_safe, pc_name_safe=pc_name_safe) 
+        # As in the overall tab, build the report in a buffer and write it with one insert at the end
+        txt = _TextChunkBuffer()
+        format_currency = self.app.CURRENCY_FORMAT.format # Bound once for every amount in the report
         
         self._insert_text_with_tags(txt, f"Statistics for {pc_name_display} ({today.strftime('%Y-%m-%d %H:%M:%S')})", ("header",))
         self._insert_separator_line(txt) 
@@ -803,9 +1149,9 @@ class ReportingTab(ttk.Frame):
 
         self._insert_text_with_tags(txt, "Open Jobs by Current Status:", ("subheader",))
         if not pc_open_jobs_df.empty:
-            status_counts_pc = pc_open_jobs_df['Status'].value_counts()
-            if not status_counts_pc.empty:
-                for status, count in status_counts_pc.items():
+            status_counts_pc = self._count_statuses_by_frequency(pc_open_jobs_df['Status'])
+            if status_counts_pc:
+                for status, count in status_counts_pc:
                     txt.insert(tk.END, f"  - {status}: ", ("indented_item", "key_value_label"))
                     self._insert_text_with_tags(txt, f"{count}", ("indented_item", "bold_metric"))
             else: self._insert_text_with_tags(txt, "  No open jobs with status information.", ("indented_item",))
@@ -814,35 +1160,38 @@ class ReportingTab(ttk.Frame):
 
         self._insert_text_with_tags(txt, "Financial Summary (for these open jobs):", ("subheader",))
         if not pc_open_jobs_df.empty and 'Balance_numeric' in pc_open_jobs_df.columns and 'InvoiceTotal_numeric' in pc_open_jobs_df.columns:
-            pc_total_invoice = pc_open_jobs_df['InvoiceTotal_numeric'].sum()
-            pc_total_outstanding_balance = pc_open_jobs_df['Balance_numeric'].sum() # Sum of 'Balance' (outstanding)
+            # Both totals from one 2-column array and a single NaN-skipping reduction (same result as Series.sum)
+            pc_total_invoice, pc_total_outstanding_balance = np.nansum( # Balance is the outstanding amount
+                pc_open_jobs_df[['InvoiceTotal_numeric', 'Balance_numeric']].to_numpy(dtype=float, na_value=np.nan), axis=0)
             pc_total_collected_calculated = pc_total_invoice - pc_total_outstanding_balance
 
             txt.insert(tk.END, "  Total Invoice Amount: ", ("indented_item", "key_value_label"))
-            self._insert_text_with_tags(txt, f"{self.app.CURRENCY_FORMAT.format(pc_total_invoice)}",("indented_item", "bold_metric"))
+            self._insert_text_with_tags(txt, format_currency(pc_total_invoice),("indented_item", "bold_metric"))
             txt.insert(tk.END, "  Total Collected (Calculated): ", ("indented_item", "key_value_label"))
-            self._insert_text_with_tags(txt, f"{self.app.CURRENCY_FORMAT.format(pc_total_collected_calculated)}", ("indented_item", "bold_metric"))
+            self._insert_text_with_tags(txt, format_currency(pc_total_collected_calculated), ("indented_item", "bold_metric"))
             txt.insert(tk.END, "  Total Remaining Balance (from 'Balance' col): ", ("indented_item", "key_value_label"))
-            self._insert_text_with_tags(txt, f"{self.app.CURRENCY_FORMAT.format(pc_total_outstanding_balance)}", ("indented_item", "bold_metric"))
+            self._insert_text_with_tags(txt, format_currency(pc_total_outstanding_balance), ("indented_item", "bold_metric"))
         elif pc_open_jobs_df.empty: self._insert_text_with_tags(txt, "  No open jobs for financial summary.", ("indented_item",))
         else: self._insert_text_with_tags(txt, "  Financial columns (Balance_numeric, InvoiceTotal_numeric) not available.", ("indented_item", "warning_text"))
         self._insert_text_with_tags(txt, "")
 
         self._insert_text_with_tags(txt, "Work-in-Progress Timing (for these open jobs, from Turn-in Date):", ("subheader",))
         if not pc_open_jobs_df.empty and 'JobAge_days' in pc_open_jobs_df.columns:
-            if 'Age_Bucket' in pc_open_jobs_df.columns and pc_open_jobs_df['Age_Bucket'].notna().any():
+            # The bucket counts double as the "any job has a bucket" check, so the column is only scanned once
+            pc_bucket_counts = self._count_age_buckets(pc_open_jobs_df['Age_Bucket']) if 'Age_Bucket' in pc_open_jobs_df.columns else []
+            if any(count for _, count in pc_bucket_counts):
                 self._insert_text_with_tags(txt, "Job Age Distribution:", ("indented_item", "key_value_label"))
-                pc_bucket_counts = pc_open_jobs_df['Age_Bucket'].value_counts().sort_index()
-                if not pc_bucket_counts.empty:
-                    for bucket, count in pc_bucket_counts.items():
+                if pc_bucket_counts:
+                    for bucket, count in pc_bucket_counts:
                         txt.insert(tk.END, f"    - {bucket}: ", ("indented_item",)) 
                         self._insert_text_with_tags(txt, f"{count} jobs", ("indented_item", "bold_metric"))
                 else: self._insert_text_with_tags(txt, "    Could not determine age distribution for this coordinator.", ("indented_item", "warning_text"))
             else: self._insert_text_with_tags(txt, "  No valid job ages to distribute into buckets for this coordinator.", ("indented_item", "warning_text"))
             self._insert_text_with_tags(txt, "")
 
-            if pc_open_jobs_df['JobAge_days'].notna().any():
-                pc_total_job_days = pc_open_jobs_df['JobAge_days'].sum()
+            pc_job_ages = pc_open_jobs_df['JobAge_days'].to_numpy(dtype=float, na_value=np.nan)
+            if not np.isnan(pc_job_ages).all():
+                pc_total_job_days = np.nansum(pc_job_ages)
                 txt.insert(tk.END, "Total Days in Progress (sum of job ages): ", ("indented_item", "key_value_label"))
                 self._insert_text_with_tags(txt, f"{pc_total_job_days:.0f} days", ("indented_item", "bold_metric"))
             else: self._insert_text_with_tags(txt, "Total Days in Progress: N/A (No valid job ages)", ("indented_item", "warning_text"))
@@ -851,7 +1200,8 @@ class ReportingTab(ttk.Frame):
         else: self._insert_text_with_tags(txt, "  Timing data ('JobAge_days') not available for this coordinator.", ("indented_item", "warning_text"))
         self._insert_text_with_tags(txt, "")
             
-        txt.config(state=tk.DISABLED) 
+        txt.flush_to(text_widget)
+        text_widget.config(state=tk.DISABLED) 
 
     def on_tab_selected(self):
         """Called when the Reporting tab is selected in the main notebook."""
@@ -864,11 +1214,7 @@ class ReportingTab(ttk.Frame):
                 self.overall_stats_text_area.config(state=tk.DISABLED)
 
              if self.weekly_intake_chart_frame:
-                if hasattr(self, 'weekly_intake_chart_canvas_widget') and self.weekly_intake_chart_canvas_widget:
-                    self.weekly_intake_chart_canvas_widget.get_tk_widget().destroy()
-                    self.weekly_intake_chart_canvas_widget = None
-                    self.weekly_intake_chart_figure = None
-                for widget in self.weekly_intake_chart_frame.winfo_children(): widget.destroy()
+                self._discard_weekly_intake_chart(self.weekly_intake_chart_frame)
                 ttk.Label(self.weekly_intake_chart_frame, text="No data loaded. Refresh after loading data.").pack(expand=True, fill=tk.BOTH)
 
 
@@ -883,11 +1229,12 @@ class ReportingTab(ttk.Frame):
             list: A list of (text_segment, list_of_applied_tkinter_tags) tuples.
                   Returns an empty list if the section is not found or has no content.
         """
-        logging.debug(f"ReportingTab: get_formatted_text_content called for section_key: '{section_key}'")
+        logging.debug("ReportingTab: get_formatted_text_content called for section_key: '%s'", section_key)
         text_widget = None
         if section_key == "overall":
             text_widget = self.overall_stats_text_area
         else:
+            self._populate_dirty_coordinator(section_key) # The export needs the text even if the tab was never opened
             text_widget = self.coordinator_tabs_widgets.get(section_key)
 
         if not text_widget or not text_widget.winfo_exists():
@@ -928,7 +1275,7 @@ class ReportingTab(ttk.Frame):
         Returns:
             bool: True if the chart was saved successfully, False otherwise.
         """
-        logging.debug(f"ReportingTab: save_chart_as_image called for chart_key: '{chart_key}' at path: '{output_image_path}'")
+        logging.debug("ReportingTab: save_chart_as_image called for chart_key: '%s' at path: '%s'", chart_key, output_image_path)
         figure_to_save = None
 
         if chart_key == "overall_status_chart":